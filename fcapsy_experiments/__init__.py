@@ -1,5 +1,14 @@
-from .correlation_table import CorrelationTable
-from .correlations_box_plot import correlations_boxplots
+from ._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "CorrelationTable": ".correlation_table",
+        "correlations_boxplots": ".correlations_box_plot",
+        "correlations_boxplots_figure": ".correlations_box_plot",
+        "Report": ".report",
+    },
+)
 
 __version__ = "0.2.6"
 __author__ = "Tomáš Mikula"
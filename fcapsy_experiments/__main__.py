@@ -0,0 +1,5 @@
+import sys
+
+from fcapsy_experiments.cli import main
+
+sys.exit(main())
@@ -0,0 +1,127 @@
+import asyncio
+import functools
+
+from concurrent.futures import ProcessPoolExecutor
+
+# computations in progress, (event loop, key) -> shared computation
+_in_flight = {}
+
+
+def make_key(*values):
+    """Hashable key of experiment configuration, unhashable leaves are keyed by identity."""
+
+    def _freeze(value):
+        if isinstance(value, dict):
+            # keyword order does not matter
+            return frozenset((key, _freeze(item)) for key, item in value.items())
+
+        if isinstance(value, (list, tuple)):
+            return tuple(_freeze(item) for item in value)
+
+        try:
+            hash(value)
+        except TypeError:
+            return ("id", id(value))
+
+        return value
+
+    return _freeze(values)
+
+
+async def run_shared(key, func, *args, executor=None, **kwargs):
+    """Runs func in executor, concurrent calls with the same key share single computation.
+
+    Cancelling an awaiter cancels only its wait, the computation itself is cancelled
+    when no awaiter is left (jobs which already started in the executor run to the end).
+
+    Args:
+        key (typing.Hashable): identity of the computation
+        func (typing.Callable): blocking function
+        executor (concurrent.futures.Executor, optional): where func runs. Defaults to None (default loop executor).
+
+    Returns:
+        result of func
+    """
+    loop = asyncio.get_running_loop()
+    shared_key = (loop, key)
+    shared = _in_flight.get(shared_key)
+
+    if shared is None:
+        future = loop.run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
+        shared = {"future": future, "awaiters": 0}
+        _in_flight[shared_key] = shared
+
+        def _forget(_, shared=shared):
+            if _in_flight.get(shared_key) is shared:
+                del _in_flight[shared_key]
+
+        future.add_done_callback(_forget)
+
+    shared["awaiters"] += 1
+
+    try:
+        return await asyncio.shield(shared["future"])
+    except asyncio.CancelledError:
+        if shared["awaiters"] == 1:
+            shared["future"].cancel()
+        raise
+    finally:
+        shared["awaiters"] -= 1
+
+
+def _compute_detached(cls, context, extent, args, kwargs):
+    """Computes experiment in worker process from concept rebuilt by its extent."""
+    experiment = cls(context.lattice[extent], *args, **kwargs)
+
+    # concepts can not be pickled, acompute attaches the original concept
+    experiment._concept = None
+
+    return experiment
+
+
+class AsyncMixin:
+    """Asynchronous construction of experiments computed from single concept."""
+
+    @classmethod
+    async def acompute(
+        cls,
+        concept: "concepts.lattices.Concept",
+        *args,
+        executor: "concurrent.futures.Executor" = None,
+        **kwargs,
+    ):
+        """Asynchronous variant of the constructor, computation runs in executor.
+
+        Concurrent calls for the same concept and arguments share single computation.
+        Concepts can not be pickled, so with ProcessPoolExecutor the context is sent
+        to the worker, which rebuilds its lattice and finds the concept by extent.
+
+        Args:
+            concept (concepts.lattices.Concept): see constructor
+            executor (concurrent.futures.Executor, optional): where computation runs. Defaults to None (default loop executor).
+
+        Returns:
+            calculated experiment (instance of cls)
+        """
+        key = make_key(cls, id(concept), args, kwargs)
+
+        if not isinstance(executor, ProcessPoolExecutor):
+            return await run_shared(
+                key, cls, concept, *args, executor=executor, **kwargs
+            )
+
+        experiment = await run_shared(
+            key,
+            _compute_detached,
+            cls,
+            concept.lattice._context,
+            concept.extent,
+            args,
+            kwargs,
+            executor=executor,
+        )
+        experiment._concept = concept
+
+        return experiment
@@ -0,0 +1,93 @@
+import collections
+import threading
+import weakref
+
+import numpy as np
+
+from fcapsy_experiments._similarity import to_bools
+
+_CACHE_SIZE = 128
+
+# (id(concept), axis) -> (weak reference to concept, view)
+_cache = collections.OrderedDict()
+_lock = threading.Lock()
+
+
+class ConceptView:
+    def __init__(self, concept: "concepts.lattices.Concept", axis: int = 0) -> None:
+        """Precomputed representations of the concept core (extent or intent).
+
+        Args:
+            concept (concepts.lattices.Concept): source concept
+            axis (int, optional): if the core are objects (0) or attributes (1). Defaults to 0.
+        """
+        context = concept.lattice._context
+
+        if axis == 0:
+            self.items_domain = context.objects
+            self.items_sets = context._intents
+            self.width = len(context.properties)
+            self.core = concept.extent
+            core_bitset = concept._extent
+        elif axis == 1:
+            self.items_domain = context.properties
+            self.items_sets = context._extents
+            self.width = len(context.objects)
+            self.core = concept.intent
+            core_bitset = concept._intent
+        else:
+            raise ValueError("Invalid axis index")
+
+        self.axis = axis
+        self.core_set = frozenset(self.core)
+        self.indices = np.fromiter(core_bitset.iter_set(), dtype=int)
+        self.mask = np.zeros(len(self.items_domain), dtype=bool)
+        self.mask[self.indices] = True
+
+        self._rows = None
+
+    @property
+    def core_sets(self) -> list:
+        """Bitsets of core items."""
+        return [self.items_sets[idx] for idx in self.indices]
+
+    @property
+    def rows(self) -> "np.ndarray":
+        """Boolean matrix, one row per core item."""
+        if self._rows is None:
+            self._rows = to_bools(self.core_sets, self.width)
+
+        return self._rows
+
+
+def _purge():
+    for key in [key for key, (ref, _) in _cache.items() if ref() is None]:
+        del _cache[key]
+
+
+def concept_view(concept: "concepts.lattices.Concept", axis: int = 0) -> ConceptView:
+    """Returns ConceptView of concept, views of recently used concepts are cached.
+
+    Cache holds only weak references to concepts, views of collected concepts
+    are dropped.
+    """
+    key = (id(concept), axis)
+
+    with _lock:
+        _purge()
+        cached = _cache.get(key)
+
+        # id of collected concept can be reused by another one
+        if cached is not None and cached[0]() is concept:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    view = ConceptView(concept, axis)
+
+    with _lock:
+        _cache[key] = (weakref.ref(concept), view)
+
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return view
@@ -0,0 +1,126 @@
+import pathlib
+import uuid
+
+import numpy as np
+import pandas as pd
+
+
+def compact_frame(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Casts labels to categoricals, floats to float32 and small integers to int32."""
+    df = df.copy()
+
+    for column in df.columns:
+        values = df[column]
+
+        if values.dtype == object or pd.api.types.is_string_dtype(values):
+            df[column] = values.astype("category")
+        elif pd.api.types.is_float_dtype(values):
+            df[column] = values.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(values) and len(values):
+            info = np.iinfo(np.int32)
+
+            if info.min <= values.min() and values.max() <= info.max:
+                df[column] = values.astype(np.int32)
+
+    return df
+
+
+def _given(partitions):
+    return {name: value for name, value in partitions.items() if value is not None}
+
+
+def _partitioned(df, partitions):
+    df = compact_frame(df)
+
+    for name, value in partitions.items():
+        df[name] = pd.Categorical([str(value)] * len(df))
+
+    return df
+
+
+def to_arrow(df: "pd.DataFrame", **partitions) -> "pyarrow.Table":
+    import pyarrow as pa
+
+    partitions = _given(partitions)
+
+    return pa.Table.from_pandas(_partitioned(df, partitions), preserve_index=False)
+
+
+def _partition_names(root_path):
+    """Partition columns of hive partitioned dataset under root_path."""
+    names = []
+    path = pathlib.Path(root_path)
+
+    while path.is_dir():
+        partitions = [child for child in path.iterdir() if "=" in child.name]
+
+        if not partitions:
+            break
+
+        names.append(partitions[0].name.split("=", 1)[0])
+        path = partitions[0]
+
+    return names
+
+
+def to_parquet(df: "pd.DataFrame", root_path, **partitions) -> None:
+    import pyarrow.parquet as pq
+
+    partitions = _given(partitions)
+    table = to_arrow(df, **partitions)
+
+    if not partitions:
+        pq.write_table(table, root_path)
+        return
+
+    existing = _partition_names(root_path)
+
+    # dataset with mixed partition layouts cannot be scanned
+    if existing and existing != list(partitions):
+        raise ValueError(
+            f"Dataset {root_path} is partitioned by {existing}, "
+            f"not by {list(partitions)}."
+        )
+
+    # unique file names, so repeated runs append to the dataset
+    pq.write_to_dataset(
+        table,
+        root_path,
+        partition_cols=list(partitions),
+        basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+    )
+
+
+class ExportMixin:
+    """Columnar export of experiment results, requires pyarrow.
+
+    Classes provide _export_frame method which returns results as long table.
+    """
+
+    def to_arrow(self, dataset: str = None, concept: str = None) -> "pyarrow.Table":
+        """Converts results into arrow table (categorical labels, float32 values).
+
+        Args:
+            dataset (str, optional): when specified, included as "dataset" column. Defaults to None.
+            concept (str, optional): when specified, included as "concept" column. Defaults to None.
+
+        Returns:
+            pyarrow.Table: results
+        """
+        return to_arrow(self._export_frame(), dataset=dataset, concept=concept)
+
+    def to_parquet(
+        self, root_path: str, dataset: str = None, concept: str = None
+    ) -> None:
+        """Writes results as parquet.
+
+        When dataset or concept is specified, results are appended into dataset under
+        root_path partitioned by them, otherwise single file root_path is written.
+        All parts of the dataset must be partitioned by the same columns.
+
+        Args:
+            root_path (str): output file or dataset directory
+            dataset (str, optional): name of the dataset, used as partition. Defaults to None.
+            concept (str, optional): name of the concept, used as partition. Defaults to None.
+        """
+        to_parquet(self._export_frame(), root_path, dataset=dataset, concept=concept)
@@ -0,0 +1,244 @@
+import html
+import uuid
+
+import numpy as np
+
+# ColorBrewer RdYlGn anchors, same as matplotlib colormap used by pandas Styler
+_RDYLGN = [
+    "#a50026",
+    "#d73027",
+    "#f46d43",
+    "#fdae61",
+    "#fee08b",
+    "#ffffbf",
+    "#d9ef8b",
+    "#a6d96a",
+    "#66bd63",
+    "#1a9850",
+    "#006837",
+]
+
+# matplotlib colormaps are quantized into 256 levels
+_LEVELS = 256
+
+# rows rendered per written chunk
+_CHUNK_ROWS = 1000
+
+
+def _gradient_lut(anchors, levels=_LEVELS, text_color_threshold=0.408):
+    """Precomputes css of every colormap level (background and contrasting text)."""
+    anchors = (
+        np.array([[int(color[i : i + 2], 16) for i in (1, 3, 5)] for color in anchors])
+        / 255
+    )
+    positions = np.linspace(0, 1, len(anchors))
+    levels = np.linspace(0, 1, levels)
+
+    rgb = np.stack(
+        [np.interp(levels, positions, anchors[:, channel]) for channel in range(3)],
+        axis=1,
+    )
+
+    linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    luminance = linear @ np.array([0.2126, 0.7152, 0.0722])
+
+    return [
+        "background-color: #{:02x}{:02x}{:02x};color: {};".format(
+            *np.round(color * 255).astype(int),
+            "#f1f1f1" if dark else "#000000",
+        )
+        for color, dark in zip(rgb, luminance < text_color_threshold)
+    ]
+
+
+_RDYLGN_LUT = _gradient_lut(_RDYLGN)
+
+
+def gradient_levels(values) -> "np.ndarray":
+    """Colormap level of every value, values are normalized by column minimum and maximum.
+
+    Returns:
+        np.ndarray: levels from 0 to 255, -1 for missing values
+    """
+    values = np.asarray(values, dtype=float)
+    valid = ~np.isnan(values)
+    levels = np.full(values.shape, -1)
+
+    if not valid.any():
+        return levels
+
+    low, high = values[valid].min(), values[valid].max()
+    norm = (values[valid] - low) / (high - low) if high > low else 0 * values[valid]
+
+    levels[valid] = np.clip((norm * _LEVELS).astype(int), 0, _LEVELS - 1)
+
+    return levels
+
+
+def _format(values, precision):
+    values = np.asarray(values)
+
+    if values.dtype.kind in "iub":
+        return values.astype(str)
+
+    if values.dtype.kind == "f":
+        return np.char.mod(f"%.{precision}f", values)
+
+    return np.array([html.escape(str(value)) for value in values], dtype=object)
+
+
+def _styles(table_id, styles):
+    rules = (
+        "#{} {} {{ {} }}".format(
+            table_id,
+            style["selector"],
+            " ".join(f"{prop}: {value};" for prop, value in style["props"]),
+        )
+        for style in styles
+    )
+
+    return "<style>\n{}\n</style>\n".format("\n".join(rules))
+
+
+def rows_slice(top_n=None, page=0, page_size=None) -> slice:
+    """Rows of the top_n truncated table shown on given page."""
+    if page_size is None:
+        return slice(0, top_n)
+
+    start = page * page_size
+    stop = start + page_size
+
+    if top_n is not None:
+        stop = min(stop, top_n)
+
+    return slice(start, max(start, stop))
+
+
+def styler_gradient(styler, df, cmap="RdYlGn"):
+    """Colors numeric columns of Styler, gradient is normalized over all rows of df.
+
+    Styler may show only some rows of df, colors of the rows stay the same as in
+    iter_table.
+    """
+    for column in df.select_dtypes(include="number").columns:
+        styler.background_gradient(
+            cmap=cmap,
+            subset=[column],
+            vmin=df[column].min(),
+            vmax=df[column].max(),
+        )
+
+    return styler
+
+
+def _cells(text, levels):
+    if levels is None:
+        return [f"<td>{value}</td>" for value in text]
+
+    return [
+        f'<td class="g{level}">{value}</td>' if level >= 0 else f"<td>{value}</td>"
+        for value, level in zip(text, levels)
+    ]
+
+
+def iter_table(
+    columns,
+    index=None,
+    styles=(),
+    gradient=True,
+    precision=3,
+    rows=None,
+):
+    """Renders table as html in chunks.
+
+    Only colormap levels are computed upfront, cells are formatted lazily
+    for every chunk of rows.
+
+    Args:
+        columns (list): list of (name, values) pairs
+        index (typing.Sequence, optional): row labels, when None the index is hidden. Defaults to None.
+        styles (list, optional): table styles in pandas Styler format. Defaults to ().
+        gradient (bool, optional): if numeric columns are colored by RdYlGn colormap. Defaults to True.
+        precision (int, optional): precision of floats. Defaults to 3.
+        rows (slice, optional): which rows are rendered, gradient is normalized over all rows. Defaults to None.
+
+    Yields:
+        str: html chunks
+    """
+    table_id = f"T_{uuid.uuid4().hex[:5]}"
+
+    names = [name for name, _ in columns]
+    columns = [np.asarray(values) for _, values in columns]
+
+    if index is not None:
+        index = np.asarray(index, dtype=object)
+
+    if columns:
+        n_rows = len(columns[0])
+    else:
+        n_rows = 0 if index is None else len(index)
+
+    start, stop, _ = (rows or slice(None)).indices(n_rows)
+
+    levels = [
+        gradient_levels(values) if gradient and values.dtype.kind in "iuf" else None
+        for values in columns
+    ]
+
+    used_levels = set()
+
+    for column_levels in levels:
+        if column_levels is not None:
+            shown = column_levels[start:stop]
+            used_levels.update(np.unique(shown[shown >= 0]).tolist())
+
+    yield _styles(table_id, list(styles))
+    yield "<style>\n{}\n</style>\n".format(
+        "\n".join(
+            f"#{table_id} .g{level} {{ {_RDYLGN_LUT[level]} }}"
+            for level in sorted(used_levels)
+        )
+    )
+
+    yield f'<table id="{table_id}">\n<thead>\n<tr>\n'
+
+    if index is not None:
+        yield '<th class="blank level0"></th>\n'
+
+    for name in names:
+        yield f'<th class="col_heading">{html.escape(str(name))}</th>\n'
+
+    yield "</tr>\n</thead>\n<tbody>\n"
+
+    for chunk_start in range(start, stop, _CHUNK_ROWS):
+        chunk = slice(chunk_start, min(chunk_start + _CHUNK_ROWS, stop))
+
+        cells = [
+            _cells(
+                _format(values[chunk], precision),
+                None if column_levels is None else column_levels[chunk],
+            )
+            for values, column_levels in zip(columns, levels)
+        ]
+
+        if index is not None:
+            cells.insert(
+                0,
+                [
+                    f'<th class="row_heading">{html.escape(str(i))}</th>'
+                    for i in index[chunk]
+                ],
+            )
+
+        yield "".join("<tr>{}</tr>\n".format("".join(row)) for row in zip(*cells))
+
+    yield "</tbody>\n</table>\n"
+
+
+def write_table(chunks, buf=None):
+    """Writes html chunks into buf, when buf is None returns html as str."""
+    if buf is None:
+        return "".join(chunks)
+
+    for chunk in chunks:
+        buf.write(chunk)
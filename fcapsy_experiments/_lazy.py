@@ -0,0 +1,28 @@
+import importlib
+import sys
+
+
+def attach(package: str, names: dict):
+    """Creates module __getattr__, __dir__ and __all__ importing names on first access (PEP 562).
+
+    Args:
+        package (str): name of the package (__name__)
+        names (dict): public names mapped to relative module names
+
+    Returns:
+        tuple: __getattr__, __dir__, __all__
+    """
+    __all__ = list(names)
+
+    def __getattr__(name):
+        if name in names:
+            module = importlib.import_module(names[name], package)
+            return getattr(module, name)
+
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        # module globals (e.g. __version__) together with not yet imported names
+        return sorted(set(vars(sys.modules[package])) | set(__all__))
+
+    return __getattr__, __dir__, __all__
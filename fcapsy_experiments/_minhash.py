@@ -0,0 +1,108 @@
+import math
+
+import numpy as np
+
+# universal hashing modulo Mersenne prime, products stay within int64
+_PRIME = (1 << 31) - 1
+
+
+def num_permutations(error: float) -> int:
+    """Number of hash functions for which the standard error of the Jaccard estimate is at most error."""
+    if not 0 < error < 0.5:
+        raise ValueError("Error bound must be in (0, 0.5).")
+
+    return math.ceil(1 / (4 * error**2))
+
+
+def _bands(num_perm, threshold):
+    """Finds (bands, rows) whose LSH threshold (1/bands)^(1/rows) is closest to threshold."""
+    best = None
+
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        distance = abs((1 / bands) ** (1 / rows) - threshold)
+
+        if best is None or distance < best[0]:
+            best = (distance, bands, rows)
+
+    return best[1], best[2]
+
+
+def _recall_similarity(bands, rows, miss_probability):
+    """Smallest similarity whose pairs share no band with probability at most miss_probability."""
+    return (1 - miss_probability ** (1 / bands)) ** (1 / rows)
+
+
+class MinHashLSH:
+    def __init__(
+        self,
+        rows: "np.ndarray",
+        error: float = 0.05,
+        threshold: float = 0.5,
+        miss_probability: float = 0.01,
+        seed: int = None,
+    ) -> None:
+        """MinHash signatures of boolean rows with LSH banding.
+
+        Pairs with similarity at least recall_similarity are LSH candidates with
+        probability at least 1 - miss_probability.
+
+        Args:
+            rows (np.ndarray): boolean matrix, one row per item
+            error (float, optional): bound of the standard error of similarity estimates. Defaults to 0.05.
+            threshold (float, optional): similarity around which LSH starts to report candidates. Defaults to 0.5.
+            miss_probability (float, optional): probability of missing pair with similarity recall_similarity. Defaults to 0.01.
+            seed (int, optional): seed of hash functions. Defaults to None.
+        """
+        rows = np.asarray(rows, dtype=bool)
+
+        self.error = error
+        self.num_perm = num_permutations(error)
+        self.bands, self.band_rows = _bands(self.num_perm, threshold)
+        self.miss_probability = miss_probability
+        self.recall_similarity = _recall_similarity(
+            self.bands, self.band_rows, miss_probability
+        )
+
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, _PRIME, self.num_perm, dtype=np.int64)
+        b = rng.integers(0, _PRIME, self.num_perm, dtype=np.int64)
+        hashes = (a[:, None] * np.arange(rows.shape[1])[None, :] + b[:, None]) % _PRIME
+
+        self.signatures = np.full((len(rows), self.num_perm), _PRIME, dtype=np.int64)
+
+        for idx, row in enumerate(rows):
+            columns = np.flatnonzero(row)
+
+            if columns.size:
+                self.signatures[idx] = hashes[:, columns].min(axis=1)
+
+        self._keys = [
+            [
+                self.signatures[
+                    idx, band * self.band_rows : (band + 1) * self.band_rows
+                ].tobytes()
+                for band in range(self.bands)
+            ]
+            for idx in range(len(rows))
+        ]
+
+
+class LSHIndex:
+    def __init__(self, lsh: "MinHashLSH") -> None:
+        """Growing set of items bucketed by LSH bands of given MinHashLSH."""
+        self._lsh = lsh
+        self._buckets = [{} for _ in range(lsh.bands)]
+
+    def add(self, item: int) -> None:
+        for buckets, key in zip(self._buckets, self._lsh._keys[item]):
+            buckets.setdefault(key, []).append(item)
+
+    def candidates(self, item: int) -> "np.ndarray":
+        """Items in index which share at least one LSH band with item."""
+        found = set()
+
+        for buckets, key in zip(self._buckets, self._lsh._keys[item]):
+            found.update(buckets.get(key, ()))
+
+        return np.fromiter(found, dtype=int, count=len(found))
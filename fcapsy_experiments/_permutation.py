@@ -0,0 +1,200 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+
+# memory used by single batch of permutations
+_BATCH_BYTES = 64 * 2**20
+
+# float64 copies of permuted values held by single batch (values, differences, signs)
+_BATCH_COPIES = 3
+
+# two-sided 99% normal quantile used by early stopping
+_Z = 2.576
+
+
+def _x_order(x) -> tuple:
+    """Order of x and end of tie of every item in that order.
+
+    In x order, sign(x[j] - x[i]) is 1 for j >= tie_end[i] and 0 for i < j < tie_end[i],
+    so signs of all pairs are described by two vectors of length n.
+
+    Returns:
+        tuple: order (argsort of x) and tie_end
+    """
+    x = np.asarray(x, dtype=float)
+    order = np.argsort(x, kind="stable")
+    ordered = x[order]
+
+    return order, np.searchsorted(ordered, ordered, side="right")
+
+
+def _statistics(values, tie_end):
+    """Kendall statistics of rows of values (in x order) against x, row by row of pairs."""
+    statistics = np.zeros(len(values))
+
+    for idx, end in enumerate(tie_end):
+        statistics += np.sign(values[:, end:] - values[:, idx, None]).sum(axis=1)
+
+    return statistics
+
+
+def kendall_statistic(x, y) -> float:
+    """Numerator of Kendall tau (concordant minus discordant pairs)."""
+    order, tie_end = _x_order(x)
+    y = np.asarray(y, dtype=float)[order]
+
+    return float(_statistics(y[None, :], tie_end)[0])
+
+
+def count_exceedances(y, tie_end, observed, size, seed) -> int:
+    """Counts permutations of y whose absolute Kendall statistic reaches observed.
+
+    Permutations of the batch are evaluated together, y is permuted uniformly,
+    so its order relative to x does not matter.
+    """
+    y = np.asarray(y, dtype=float)
+    permuted = np.random.default_rng(seed).permuted(np.tile(y, (size, 1)), axis=1)
+    statistics = _statistics(permuted, tie_end)
+
+    # statistics are sums of -1, 0, 1, exact in float64
+    return int((np.abs(statistics) >= abs(observed)).sum())
+
+
+def permutation_p_value(
+    x,
+    y,
+    permutations: int = 10000,
+    alpha: float = 0.04,
+    executor: "concurrent.futures.Executor" = None,
+    n_jobs: int = 1,
+    seed: "np.random.SeedSequence" = None,
+    min_permutations: int = 100,
+) -> float:
+    """Two-sided permutation p-value of Kendall correlation.
+
+    Permutations are evaluated in rounds of batches, sampling stops early when the 99%
+    confidence interval of the p-value estimate lies entirely below or above alpha.
+    First round evaluates min_permutations, every next round is twice as large
+    (batches are limited by memory budget), so clear cases stop early.
+
+    Args:
+        x (np.ndarray): first variable
+        y (np.ndarray): second variable
+        permutations (int, optional): maximal number of permutations. Defaults to 10000.
+        alpha (float, optional): significance level for early stopping. Defaults to 0.04.
+        executor (concurrent.futures.Executor, optional): executor for batches. Defaults to None (current process).
+        n_jobs (int, optional): batches evaluated in one round. Defaults to 1.
+        seed (np.random.SeedSequence, optional): seed of permutations. Defaults to None.
+        min_permutations (int, optional): permutations before early stopping is considered. Defaults to 100.
+
+    Returns:
+        float: p-value estimate (exceedances + 1) / (permutations + 1)
+    """
+    # x is described once for all batches by its order and ties
+    order, tie_end = _x_order(x)
+    y = np.asarray(y, dtype=float)[order]
+
+    permutation_bytes = max(1, len(y)) * 8 * _BATCH_COPIES
+    max_batch = max(1, _BATCH_BYTES // permutation_bytes)
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    observed = _statistics(y[None, :], tie_end)[0]
+
+    done, exceedances = 0, 0
+    round_size = max(1, min_permutations)
+
+    while done < permutations:
+        size = min(round_size, permutations - done, n_jobs * max_batch)
+        batch = math.ceil(size / n_jobs)
+        sizes = [min(batch, size - start) for start in range(0, size, batch)]
+        round_size *= 2
+
+        seeds = seed.spawn(len(sizes))
+
+        if executor is None:
+            counts = [
+                count_exceedances(y, tie_end, observed, size, batch_seed)
+                for size, batch_seed in zip(sizes, seeds)
+            ]
+        else:
+            counts = executor.map(
+                count_exceedances,
+                *zip(
+                    *[(y, tie_end, observed, size, s) for size, s in zip(sizes, seeds)]
+                ),
+            )
+
+        exceedances += sum(counts)
+        done += sum(sizes)
+
+        p_value = (exceedances + 1) / (done + 1)
+
+        if done >= min_permutations:
+            half_width = _Z * math.sqrt(p_value * (1 - p_value) / done)
+
+            if p_value + half_width < alpha or p_value - half_width > alpha:
+                break
+
+    return p_value
+
+
+def permutation_p_values(
+    source: "pd.DataFrame",
+    permutations: int = 10000,
+    alpha: float = 0.04,
+    n_jobs: int = 1,
+    random_state: int = None,
+) -> "pd.DataFrame":
+    """Permutation p-values of Kendall correlation for every pair of columns.
+
+    Args:
+        source (pd.DataFrame): source data
+        permutations (int, optional): maximal number of permutations per pair. Defaults to 10000.
+        alpha (float, optional): significance level for early stopping. Defaults to 0.04.
+        n_jobs (int, optional): number of processes, 1 means current process. Defaults to 1.
+        random_state (int, optional): seed. Defaults to None.
+
+    Returns:
+        pd.DataFrame: p-values (diagonal is 1 as in pandas DataFrame.corr)
+    """
+    columns = list(source.columns)
+    p_values = pd.DataFrame(1.0, index=columns, columns=columns)
+    seeds = np.random.SeedSequence(random_state).spawn(len(columns) ** 2)
+
+    executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+
+    try:
+        for i, column1 in enumerate(columns):
+            for j, column2 in enumerate(columns[i + 1 :], start=i + 1):
+                x = source[column1].to_numpy(dtype=float)
+                y = source[column2].to_numpy(dtype=float)
+
+                # same pairs as in DataFrame.corr, missing values are dropped
+                finite = np.isfinite(x) & np.isfinite(y)
+                x, y = x[finite], y[finite]
+
+                if len(x) < 2:
+                    p_value = np.nan
+                else:
+                    p_value = permutation_p_value(
+                        x,
+                        y,
+                        permutations=permutations,
+                        alpha=alpha,
+                        executor=executor,
+                        n_jobs=n_jobs,
+                        seed=seeds[i * len(columns) + j],
+                    )
+
+                p_values.loc[column1, column2] = p_value
+                p_values.loc[column2, column1] = p_value
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return p_values
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, threshold: int) -> "np.ndarray":
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        x (np.ndarray): increasing x coordinates
+        y (np.ndarray): y coordinates
+        threshold (int): number of points which are kept
+
+    Returns:
+        np.ndarray: indices of kept points (first and last point are always kept)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    size = len(x)
+
+    if threshold is None or threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    every = (size - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, size - 1
+    a = 0
+
+    for bucket in range(threshold - 2):
+        # average point of the next bucket
+        next_start = int((bucket + 1) * every) + 1
+        next_stop = min(int((bucket + 2) * every) + 1, size)
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+
+        start = int(bucket * every) + 1
+        stop = int((bucket + 1) * every) + 1
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (avg_y - y[a])
+        )
+
+        a = start + int(areas.argmax())
+        selected[bucket + 1] = a
+
+    return selected
+
+
+def density_bins(data: "pd.DataFrame", coordinates, bins: int) -> "pd.DataFrame":
+    """Aggregates points into regular grid cells.
+
+    Args:
+        data (pd.DataFrame): points, other numeric columns are averaged
+        coordinates (list): names of coordinate columns
+        bins (int): number of bins per coordinate
+
+    Returns:
+        pd.DataFrame: one row per non-empty cell with mean coordinates, averaged columns and "count"
+    """
+    cells = []
+
+    for coordinate in coordinates:
+        values = data[coordinate].to_numpy(dtype=float)
+        low, high = values.min(), values.max()
+        width = (high - low) / bins if high > low else 1
+
+        cells.append(np.clip(((values - low) / width).astype(int), 0, bins - 1))
+
+    groups = data.groupby(cells, sort=False)
+    aggregated = groups.mean(numeric_only=True)
+    aggregated["count"] = groups.size()
+
+    return aggregated.reset_index(drop=True)
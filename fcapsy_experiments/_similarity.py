@@ -0,0 +1,176 @@
+import numpy as np
+
+from binsdpy.similarity import jaccard, smc, russell_rao
+
+
+def _divide(numerator, denominator):
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.broadcast(numerator, denominator).shape),
+        where=denominator != 0,
+    )
+
+
+def _jaccard(a, b, c, d):
+    return _divide(a, a + b + c)
+
+
+def _smc(a, b, c, d):
+    return _divide(a + d, a + b + c + d)
+
+
+def _russell_rao(a, b, c, d):
+    return _divide(a, a + b + c + d)
+
+
+# similarities which can be evaluated from contingency counts for whole matrices
+COUNT_SIMILARITIES = {
+    jaccard: _jaccard,
+    smc: _smc,
+    russell_rao: _russell_rao,
+}
+
+# approximate number of float64 temporaries held per tile cell
+_TILE_CELL_BYTES = 8 * 8
+
+
+def is_vectorized(similarity) -> bool:
+    """Returns True if similarity can be evaluated on whole matrices."""
+    return similarity in COUNT_SIMILARITIES
+
+
+def to_bools(bitsets, width: int = None) -> "np.ndarray":
+    """Converts sequence of bitsets into boolean matrix (one row per bitset).
+
+    Args:
+        bitsets (typing.Sequence[bitsets.bases.BitSet]): source bitsets
+        width (int, optional): number of columns, needed when bitsets are empty. Defaults to None.
+
+    Returns:
+        np.ndarray: boolean matrix
+    """
+    if not len(bitsets):
+        return np.zeros((0, width or 0), dtype=bool)
+
+    return np.array([bitset.bools() for bitset in bitsets], dtype=bool)
+
+
+def _row_sums(Y, weights=None):
+    return Y.sum(axis=1) if weights is None else Y @ weights
+
+
+def pairwise_counts(X, Y, weights=None, y_sums=None):
+    """Calculates contingency counts a, b, c, d between rows of X and Y.
+
+    Args:
+        X (np.ndarray): boolean matrix (n x m)
+        Y (np.ndarray): boolean matrix (k x m)
+        weights (np.ndarray, optional): weights of the m coordinates. Defaults to None.
+        y_sums (np.ndarray, optional): precomputed (weighted) row sums of Y. Defaults to None.
+
+    Returns:
+        tuple: four matrices (n x k)
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+
+    if weights is None:
+        total = X.shape[1]
+        Xw = X
+    else:
+        weights = np.asarray(weights, dtype=float)
+        total = weights.sum()
+        Xw = X * weights
+
+    if y_sums is None:
+        y_sums = _row_sums(Y, weights)
+
+    a = Xw @ Y.T
+
+    b = Xw.sum(axis=1)[:, None] - a
+    c = y_sums[None, :] - a
+    d = total - a - b - c
+
+    return a, b, c, d
+
+
+def pairwise_similarity(X, Y, similarity, weights=None, y_sums=None) -> "np.ndarray":
+    """Calculates similarity matrix between rows of X and Y."""
+    return COUNT_SIMILARITIES[similarity](*pairwise_counts(X, Y, weights, y_sums))
+
+
+def tile_shape(
+    n_rows: int, n_columns: int, n_features: int, max_memory: int = None
+) -> tuple:
+    """Number of rows and columns of a similarity tile which fits into max_memory bytes.
+
+    Tile holds its similarity cells and float copies of n_features coordinates of
+    its source rows (rows) and target rows (columns), at most half of max_memory
+    is used by the target rows.
+    """
+    if max_memory is None:
+        return max(1, n_rows), max(1, n_columns)
+
+    feature_bytes = n_features * 8
+    columns = max(1, min(n_columns, (int(max_memory) // 2) // max(1, feature_bytes)))
+    remaining = int(max_memory) - columns * feature_bytes
+    rows = max(1, remaining // (columns * _TILE_CELL_BYTES + feature_bytes))
+
+    return rows, columns
+
+
+def iter_tiles(X, Y, similarity, max_memory=None):
+    """Yields tiles of similarity matrix between X and Y.
+
+    Every tile covers rows start:stop of X and a block of rows of Y, row
+    reductions are accumulated over all tiles of the rows.
+
+    Args:
+        X (np.ndarray): boolean matrix (n x m)
+        Y (np.ndarray): boolean matrix (k x m)
+        similarity (typing.Callable): similarity from binsdpy, see COUNT_SIMILARITIES
+        max_memory (int, optional): peak memory in bytes used by single tile together with float copies of its rows. Defaults to None (single tile).
+
+    Blocks of Y are converted to float once per pass.
+
+    Yields:
+        tuple: start row, stop row and similarity tile
+    """
+    n_rows = len(X)
+    step, y_step = tile_shape(n_rows, len(Y), np.shape(Y)[1], max_memory)
+
+    for y_start in range(0, len(Y), y_step):
+        block = np.asarray(Y[y_start : y_start + y_step], dtype=float)
+        y_sums = _row_sums(block)
+
+        for start in range(0, n_rows, step):
+            stop = min(start + step, n_rows)
+            yield start, stop, pairwise_similarity(
+                X[start:stop], block, similarity, y_sums=y_sums
+            )
+
+
+def blocked_row_sums(X, Y, similarity, max_memory=None) -> "np.ndarray":
+    """Row sums of similarity matrix between X and Y without materializing it."""
+    sums = np.zeros(len(X))
+
+    for start, stop, tile in iter_tiles(X, Y, similarity, max_memory):
+        sums[start:stop] += tile.sum(axis=1)
+
+    return sums
+
+
+def blocked_row_means(X, Y, similarity, max_memory=None) -> "np.ndarray":
+    """Row means of similarity matrix between X and Y without materializing it."""
+    return blocked_row_sums(X, Y, similarity, max_memory) / len(Y)
+
+
+def blocked_row_max(X, Y, similarity, max_memory=None) -> "np.ndarray":
+    """Row maxima of similarity matrix between X and Y without materializing it."""
+    maxima = np.full(len(X), -np.inf)
+
+    for start, stop, tile in iter_tiles(X, Y, similarity, max_memory):
+        np.maximum(maxima[start:stop], tile.max(axis=1), out=maxima[start:stop])
+
+    return maxima
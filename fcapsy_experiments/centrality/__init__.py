@@ -1 +1,3 @@
-from .centrality import Centrality
+from fcapsy_experiments._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {"Centrality": ".centrality"})
@@ -1,10 +1,21 @@
+import typing
+
 import pandas as pd
 
 from fcapsy.centrality import centrality
+from fcapsy_experiments._async import AsyncMixin
+from fcapsy_experiments._concept_view import concept_view
+from fcapsy_experiments._export import ExportMixin
+from fcapsy_experiments._html import (
+    iter_table,
+    rows_slice,
+    styler_gradient,
+    write_table,
+)
 from fcapsy_experiments._styles import css, css_centrality
 
 
-class Centrality:
+class Centrality(AsyncMixin, ExportMixin):
     core_label = "is core"
     centrality_label = "Centrality"
 
@@ -24,16 +35,10 @@ class Centrality:
             core_indicator (bool, optional): if concept core indicators should be included. Defaults to False.
         """
         self._concept = concept
+        self._view = concept_view(concept, axis)
 
-        context = self._concept.lattice._context
-        if axis == 0:
-            self._items_domain = context.objects
-            self._concept_core = self._concept.extent
-        elif axis == 1:
-            self._items_domain = context.properties
-            self._concept_core = self._concept.intent
-        else:
-            raise ValueError("Invalid axis index")
+        self._items_domain = self._view.items_domain
+        self._concept_core = self._view.core
 
         self.axis = axis
 
@@ -56,18 +61,21 @@ class Centrality:
                 df[name] = values
 
         if core_indicator:
-            df[self.core_label] = [
-                int(item in self._concept_core) for item in self._items_domain
-            ]
+            df[self.core_label] = self._view.mask.astype(int)
 
         return df
 
+    def _export_frame(self):
+        return self.df.rename_axis("item").reset_index()
+
     def _filter_sort_df(self, include_core_flag=False, quantile=0.75):
         """Filters results which are equals to zero and anythig which is not present in quantile."""
         filtered_df = self.df.loc[self.df[self.centrality_label] > 0]
 
         if not include_core_flag:
-            filtered_df = filtered_df.drop(list(self._concept_core.members()), axis=0)
+            filtered_df = filtered_df.loc[
+                [item not in self._view.core_set for item in filtered_df.index]
+            ]
 
         quantile_value = filtered_df.quantile(quantile)[self.centrality_label]
         filtered_df = filtered_df.loc[
@@ -79,22 +87,47 @@ class Centrality:
 
         return filtered_df
 
-    def to_html(self, include_core_flag: bool = False, quantile: float = 0.75) -> str:
+    def to_html(
+        self,
+        include_core_flag: bool = False,
+        quantile: float = 0.75,
+        fast: bool = False,
+        top_n: int = None,
+        page: int = 0,
+        page_size: int = None,
+        buf: "typing.TextIO" = None,
+    ) -> typing.Optional[str]:
         """Generates html table.
 
         Args:
             include_core_flag (bool, optional): column with information if item is definition core of concept. Defaults to False.
             quantile (float, optional): values outside this quantile will be filtered out. Defaults to 0.75.
+            fast (bool, optional): if table is rendered by vectorized renderer instead of pandas Styler. Defaults to False.
+            top_n (int, optional): only top_n rows are included. Defaults to None.
+            page (int, optional): which page is rendered when page_size is specified. Defaults to 0.
+            page_size (int, optional): number of rows per page. Defaults to None.
+            buf (typing.TextIO, optional): when specified (only with fast), html is streamed into buf and None is returned. Defaults to None.
 
         Returns:
-            str: html output
+            typing.Optional[str]: html output
         """
         final_table = self._filter_sort_df(
             include_core_flag=include_core_flag, quantile=quantile
         )
-
-        final_table = final_table.style.format(precision=3)
-        final_table.background_gradient(cmap="RdYlGn")
-        final_table.set_table_styles(css + css_centrality)
-
-        return final_table.to_html()
+        rows = rows_slice(top_n, page, page_size)
+
+        if fast:
+            chunks = iter_table(
+                [(column, final_table[column].to_numpy()) for column in final_table],
+                index=final_table.index,
+                styles=css + css_centrality,
+                precision=3,
+                rows=rows,
+            )
+            return write_table(chunks, buf)
+
+        styler = final_table.iloc[rows].style.format(precision=3)
+        styler_gradient(styler, final_table)
+        styler.set_table_styles(css + css_centrality)
+
+        return styler.to_html()
@@ -0,0 +1,252 @@
+"""Command-line batch runner of experiments over directory of formal contexts.
+
+Experiment spec is json file, for example::
+
+    {
+        "experiments": ["typicality", "centrality", "mca"],
+        "axes": [0, 1],
+        "similarities": ["jaccard", "smc", "russell_rao"]
+    }
+
+Every (context, concept, experiment, axis) is single job, finished jobs are recorded
+in checkpoint.jsonl of the output directory together with their timing, so rerunning
+the same command resumes the batch.
+"""
+import argparse
+import functools
+import json
+import logging
+import os
+import pathlib
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+logger = logging.getLogger("fcapsy_experiments")
+
+CHECKPOINT = "checkpoint.jsonl"
+
+FORMATS = {".cxt": "cxt", ".csv": "csv"}
+
+EXPERIMENTS = ["typicality", "centrality", "mca"]
+
+DEFAULT_SPEC = {
+    "experiments": EXPERIMENTS,
+    "axes": [0],
+    "similarities": ["jaccard", "smc", "russell_rao"],
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_lattice(path):
+    import concepts
+
+    path = pathlib.Path(path)
+    context = concepts.Context.fromfile(str(path), frmat=FORMATS[path.suffix.lower()])
+
+    return context.lattice
+
+
+def _typicality_functions(similarities):
+    from binsdpy import similarity
+    from fcapsy.typicality import typicality_avg
+
+    return {
+        "typ_avg": {
+            "func": typicality_avg,
+            "args": {
+                name: {"similarity": getattr(similarity, name)} for name in similarities
+            },
+        }
+    }
+
+
+def _unknown_similarities(names):
+    from binsdpy import similarity
+
+    return {name for name in names if not callable(getattr(similarity, name, None))}
+
+
+def _job_id(job):
+    path, index, experiment, axis = job
+    return f"{pathlib.Path(path).name}:{index}:{experiment}:{axis}"
+
+
+def _output_path(output_dir, job):
+    path, index, experiment, axis = job
+    filename = f"{index}_{experiment}_{axis}.html"
+
+    # full file name, contexts foo.cxt and foo.csv have separate outputs
+    return pathlib.Path(output_dir) / pathlib.Path(path).name / filename
+
+
+def run_job(job, spec, output_dir):
+    """Runs single job and writes its html output.
+
+    Returns:
+        float: duration of the job in seconds
+    """
+    path, index, experiment, axis = job
+    start = time.perf_counter()
+
+    concept = _load_lattice(path)[index]
+
+    if experiment == "typicality":
+        from fcapsy_experiments.typicality import ConceptTypicality
+
+        output = ConceptTypicality(
+            concept,
+            axis=axis,
+            typicality_functions=_typicality_functions(spec["similarities"]),
+        ).to_html()
+    elif experiment == "centrality":
+        from fcapsy_experiments.centrality import Centrality
+
+        output = Centrality(concept, axis=axis).to_html()
+    elif experiment == "mca":
+        from fcapsy_experiments.mca import MCAConcept
+
+        output = MCAConcept(concept).to_plotly_html()
+    else:
+        raise ValueError(f"Experiment {experiment} is not supported.")
+
+    target = _output_path(output_dir, job)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    # write whole file or nothing, partial outputs are never checkpointed
+    tmp = target.with_suffix(".tmp")
+    tmp.write_text(output, encoding="utf-8")
+    os.replace(tmp, target)
+
+    return time.perf_counter() - start
+
+
+def _read_checkpoint(output_dir):
+    checkpoint = pathlib.Path(output_dir) / CHECKPOINT
+
+    if not checkpoint.exists():
+        return set()
+
+    done = set()
+
+    with open(checkpoint, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # last line of interrupted run
+                continue
+
+            if record.get("status") == "done":
+                done.add(record["job"])
+
+    return done
+
+
+def _extent_sizes(path):
+    return [len(concept.extent) for concept in _load_lattice(path)]
+
+
+def list_jobs(contexts_dir, spec, executor=None):
+    """Lists jobs for every concept of every context in contexts_dir.
+
+    Lattices are built in executor when given, so they are counted in parallel.
+    MCA jobs are listed only for concepts with at least two objects.
+    """
+    paths = [
+        str(path)
+        for path in sorted(pathlib.Path(contexts_dir).iterdir())
+        if path.suffix.lower() in FORMATS
+    ]
+    sizes = (executor.map if executor else map)(_extent_sizes, paths)
+
+    jobs = []
+
+    for path, extent_sizes in zip(paths, sizes):
+        for index, extent_size in enumerate(extent_sizes):
+            for experiment in spec["experiments"]:
+                if experiment == "mca":
+                    # MCA is calculated only for objects, projection needs two of them
+                    axes = [0] if extent_size > 1 else []
+                else:
+                    axes = spec["axes"]
+
+                for axis in axes:
+                    jobs.append((path, index, experiment, axis))
+
+    return jobs
+
+
+def run(contexts_dir, spec, output_dir, workers=None):
+    """Runs all not yet finished jobs in process pool.
+
+    Returns:
+        int: number of failed jobs
+    """
+    pathlib.Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    done = _read_checkpoint(output_dir)
+    failed = 0
+
+    with open(
+        pathlib.Path(output_dir) / CHECKPOINT, "a", encoding="utf-8"
+    ) as checkpoint, ProcessPoolExecutor(max_workers=workers) as executor:
+        jobs = [
+            job
+            for job in list_jobs(contexts_dir, spec, executor)
+            if _job_id(job) not in done
+        ]
+
+        logger.info("%d jobs finished earlier, %d jobs to run", len(done), len(jobs))
+
+        futures = {executor.submit(run_job, job, spec, output_dir): job for job in jobs}
+
+        for future in as_completed(futures):
+            job_id = _job_id(futures[future])
+
+            try:
+                seconds = future.result()
+            except Exception as e:
+                failed += 1
+                record = {"job": job_id, "status": "error", "error": repr(e)}
+                logger.error("%s failed: %r", job_id, e)
+            else:
+                record = {"job": job_id, "status": "done", "seconds": seconds}
+                logger.info("%s done in %.3fs", job_id, seconds)
+
+            checkpoint.write(json.dumps(record) + "\n")
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="fcapsy-experiments",
+        description="Runs experiments for every concept of every context in directory.",
+    )
+    parser.add_argument("contexts", help="directory with formal contexts (.cxt, .csv)")
+    parser.add_argument("spec", help="json experiment spec")
+    parser.add_argument("output", help="output directory")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of worker processes"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    with open(args.spec, encoding="utf-8") as f:
+        spec = {**DEFAULT_SPEC, **json.load(f)}
+
+    unknown = set(spec["experiments"]) - set(EXPERIMENTS)
+
+    if unknown:
+        parser.error(f"unsupported experiments: {', '.join(sorted(unknown))}")
+
+    unknown = _unknown_similarities(spec["similarities"])
+
+    if unknown:
+        parser.error(f"unknown similarities: {', '.join(sorted(unknown))}")
+
+    return 1 if run(args.contexts, spec, args.output, workers=args.jobs) else 0
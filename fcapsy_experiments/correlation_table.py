@@ -1,38 +1,65 @@
 import typing
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-
-from fuzzycorr import fuzzy_correlation_factory
-from fuzzycorr.strict_orderings import lukasiewicz_strict_ordering_factory
-from fuzzycorr.t_norms import godel
-from scipy.stats import kendalltau, pearsonr
 
+from fcapsy_experiments import _export
+from fcapsy_experiments._async import make_key, run_shared
+from fcapsy_experiments._export import ExportMixin
+from fcapsy_experiments._permutation import permutation_p_values
 from fcapsy_experiments._styles import css, css_corr
 
+# correlations in order of CorrelationTable exports
+CORRELATIONS = ("kendall", "pearson", "fuzzy")
+
 
 class Correlation:
-    def __init__(self, source: "pd.DataFrame", type: str) -> None:
+    def __init__(
+        self,
+        source: "pd.DataFrame",
+        type: str,
+        permutations: int = None,
+        n_jobs: int = 1,
+        random_state: int = None,
+    ) -> None:
         """Calculates correlation for source dataframe
 
         Args:
             source (pd.DataFrame): source data
             type (str): type of correlation ("kendall", "pearson", "fuzzy")
+            permutations (int, optional): when specified, p-values of kendall correlation are computed by permutation test with at most this many permutations (stops early once significance at 0.04 is clear). Defaults to None (asymptotic p-values).
+            n_jobs (int, optional): number of processes used by permutation test. Defaults to 1.
+            random_state (int, optional): seed of permutation test. Defaults to None.
         """
         self.type = type
+        self.permutations = permutations
+        self.n_jobs = n_jobs
+        self.random_state = random_state
         self.corr, self.p_values = self._init(self, source)
 
     @staticmethod
     def _init(inst, source):
         if inst.type in ["kendall", "pearson"]:
+            from scipy.stats import kendalltau, pearsonr
+
             funcs = {"kendall": kendalltau, "pearson": pearsonr}
             corr = funcs[inst.type]
 
+            if inst.type == "kendall" and inst.permutations is not None:
+                return source.corr(lambda x, y: corr(x, y)[0]), permutation_p_values(
+                    source,
+                    permutations=inst.permutations,
+                    n_jobs=inst.n_jobs,
+                    random_state=inst.random_state,
+                )
+
             return source.corr(lambda x, y: corr(x, y)[0]), source.corr(
                 lambda x, y: corr(x, y)[1]
             )
         elif inst.type in ["fuzzy"]:
+            from fuzzycorr import fuzzy_correlation_factory
+            from fuzzycorr.strict_orderings import lukasiewicz_strict_ordering_factory
+            from fuzzycorr.t_norms import godel
+
             ordering = lukasiewicz_strict_ordering_factory(r=0.2)
             corr = fuzzy_correlation_factory(ordering, godel)
             return source.corr(corr), None
@@ -93,6 +120,8 @@ class Correlation:
         return df.to_html()
 
     def to_plotly(self) -> "go.Figure":
+        import plotly.express as px
+
         fig = px.imshow(self.corr)
         return fig
 
@@ -104,26 +133,112 @@ class Correlation:
         )
 
 
-class CorrelationTable:
-    def __init__(self, source: "pd.DataFrame", dataset: str = None) -> None:
+class CorrelationTable(ExportMixin):
+    def __init__(
+        self,
+        source: "pd.DataFrame",
+        dataset: str = None,
+        permutations: int = None,
+        n_jobs: int = 1,
+        random_state: int = None,
+    ) -> None:
         """Represents multiple correlation tables for given source dataframe.
 
         Args:
             source (pd.DataFrame): source dataframe
             dataset (str, optional): name of the dataset. Defaults to None.
+            permutations (int, optional): when specified, kendall p-values are computed by permutation test, see Correlation. Defaults to None.
+            n_jobs (int, optional): number of processes used by permutation test. Defaults to 1.
+            random_state (int, optional): seed of permutation test. Defaults to None.
         """
         self.dataset = dataset
         self.source = source
+        self._kendall_options = {
+            "permutations": permutations,
+            "n_jobs": n_jobs,
+            "random_state": random_state,
+        }
 
         self._kendall = None
         self._pearson = None
         self._fuzzy = None
 
+    def _export_frame(self, types):
+        frames = []
+
+        for type in types:
+            if type not in CORRELATIONS:
+                raise ValueError(f"Correlation {type} is not supported.")
+
+            correlation = getattr(self, type)
+            corr = correlation.corr
+
+            df = pd.DataFrame(
+                {
+                    "correlation": correlation.type,
+                    "column1": np.repeat(corr.index.to_numpy(), len(corr.columns)),
+                    "column2": np.tile(corr.columns.to_numpy(), len(corr.index)),
+                    "value": corr.to_numpy(dtype=float).ravel(),
+                    "p_value": np.nan,
+                }
+            )
+
+            if correlation.p_values is not None:
+                df["p_value"] = correlation.p_values.to_numpy(dtype=float).ravel()
+
+            frames.append(df)
+
+        return pd.concat(frames, ignore_index=True)
+
+    def to_arrow(
+        self,
+        dataset: str = None,
+        concept: str = None,
+        types: typing.Iterable[str] = CORRELATIONS,
+    ) -> "pyarrow.Table":
+        """Converts correlation tables into long arrow table.
+
+        Args:
+            dataset (str, optional): "dataset" column, defaults to name of the dataset. Defaults to None.
+            concept (str, optional): when specified, included as "concept" column. Defaults to None.
+            types (typing.Iterable[str], optional): exported correlations. Defaults to CORRELATIONS (kendall, pearson and fuzzy).
+
+        Returns:
+            pyarrow.Table: correlations
+        """
+        return _export.to_arrow(
+            self._export_frame(types),
+            dataset=dataset or self.dataset,
+            concept=concept,
+        )
+
+    def to_parquet(
+        self,
+        root_path: str,
+        dataset: str = None,
+        concept: str = None,
+        types: typing.Iterable[str] = CORRELATIONS,
+    ) -> None:
+        """Writes correlation tables as parquet, see ExportMixin.to_parquet.
+
+        Args:
+            root_path (str): output file or dataset directory
+            dataset (str, optional): partition, defaults to name of the dataset. Defaults to None.
+            concept (str, optional): partition. Defaults to None.
+            types (typing.Iterable[str], optional): exported correlations. Defaults to CORRELATIONS (kendall, pearson and fuzzy).
+        """
+        _export.to_parquet(
+            self._export_frame(types),
+            root_path,
+            dataset=dataset or self.dataset,
+            concept=concept,
+        )
+
     @property
     def kendall(self) -> "Correlation":
         """Returns kendall correlation table."""
         if self._kendall is None:
-            self._kendall = Correlation(self.source, "kendall")
+            self._kendall = Correlation(self.source, "kendall", **self._kendall_options)
 
         return self._kendall
 
@@ -142,3 +257,49 @@ class CorrelationTable:
             self._fuzzy = Correlation(self.source, "fuzzy")
 
         return self._fuzzy
+
+    async def _acorrelation(self, type, executor, **options):
+        attribute = f"_{type}"
+
+        if getattr(self, attribute) is None:
+            correlation = await run_shared(
+                make_key(id(self), type),
+                Correlation,
+                self.source,
+                type,
+                executor=executor,
+                **options,
+            )
+            setattr(self, attribute, correlation)
+
+        return getattr(self, attribute)
+
+    async def akendall(
+        self, executor: "concurrent.futures.Executor" = None
+    ) -> "Correlation":
+        """Returns kendall correlation table, computation runs in executor.
+
+        Args:
+            executor (concurrent.futures.Executor, optional): where computation runs. Defaults to None (default loop executor).
+        """
+        return await self._acorrelation("kendall", executor, **self._kendall_options)
+
+    async def apearson(
+        self, executor: "concurrent.futures.Executor" = None
+    ) -> "Correlation":
+        """Returns pearson correlation table, computation runs in executor.
+
+        Args:
+            executor (concurrent.futures.Executor, optional): where computation runs. Defaults to None (default loop executor).
+        """
+        return await self._acorrelation("pearson", executor)
+
+    async def afuzzy(
+        self, executor: "concurrent.futures.Executor" = None
+    ) -> "Correlation":
+        """Returns fuzzy correlation table, computation runs in executor.
+
+        Args:
+            executor (concurrent.futures.Executor, optional): where computation runs. Defaults to None (default loop executor).
+        """
+        return await self._acorrelation("fuzzy", executor)
@@ -1,10 +1,11 @@
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
 
 
-def correlations_boxplots(correlations, to):
+def correlations_boxplots_figure(correlations, to) -> "go.Figure":
     """WIP"""
+    import plotly.graph_objects as go
+
     rows = []
 
     for correlation in correlations:
@@ -65,7 +66,12 @@ def correlations_boxplots(correlations, to):
     )
     fig.update_traces(orientation="h")
 
-    return fig.to_html(
+    return fig
+
+
+def correlations_boxplots(correlations, to) -> str:
+    """WIP"""
+    return correlations_boxplots_figure(correlations, to).to_html(
         full_html=False,
         include_plotlyjs="cdn",
         include_mathjax="cdn",
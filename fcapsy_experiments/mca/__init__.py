@@ -1 +1,5 @@
-from .mca_concept import MCAConcept
+from fcapsy_experiments._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, {"MCAConcept": ".mca_concept", "MCAModel": ".mca_model"}
+)
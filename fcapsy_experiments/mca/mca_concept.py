@@ -1,11 +1,18 @@
-import prince
+import os
+import typing
+
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 import textwrap
 
+from fcapsy_experiments._async import AsyncMixin
+from fcapsy_experiments._concept_view import concept_view
+from fcapsy_experiments._export import ExportMixin
+from fcapsy_experiments._plotting import density_bins
+
+from .mca_model import MCAModel
 
-class MCAConcept:
+
+class MCAConcept(AsyncMixin, ExportMixin):
     def __init__(
         self,
         concept: "concepts.lattices.Concept",
@@ -13,48 +20,87 @@ class MCAConcept:
         random_state=42,
         n_iter=100,
         color_by=None,
+        model: typing.Union["MCAModel", str, "os.PathLike"] = None,
+        refit: bool = False,
     ) -> None:
+        """Calculates MCA projection of concept extent.
+
+        Args:
+            concept (concepts.lattices.Concept): projected concept
+            n_components (int, optional): number of components. Defaults to 2.
+            random_state (int, optional): random state of MCA. Defaults to 42.
+            n_iter (int, optional): number of iterations of MCA. Defaults to 100.
+            color_by (tuple, optional): name and values which are used as marker color. Defaults to None.
+            model (typing.Union[MCAModel, str, os.PathLike], optional): fitted model (or path to trusted saved one, see MCAModel.load), e.g. fitted on parent concept, which is used for projection instead of fitting. Defaults to None.
+            refit (bool, optional): if model is refitted on this concept, components keep orientation of the given model. Defaults to False.
+        """
         self._concept = concept
         self.concept_df = self._concept_df()
-        self.n_components = n_components
         self._color_by = color_by
 
-        self.mca = prince.MCA(
-            n_components=n_components, random_state=random_state, n_iter=n_iter
-        )
-        self.mca.fit(self.concept_df)
+        if isinstance(model, (str, os.PathLike)):
+            model = MCAModel.load(model)
 
-        self.concept_df_transformed = pd.DataFrame(
-            self.mca.transform(self.concept_df), index=self._concept.extent
-        )
+        if model is None or refit:
+            model = MCAModel.fit(
+                self.concept_df,
+                n_components=n_components,
+                random_state=random_state,
+                n_iter=n_iter,
+                previous=model,
+            )
+
+        self.model = model
+        self.mca = model.mca
+        self.n_components = model.n_components
+
+        self.concept_df_transformed = model.transform(self.concept_df)
+
+    def save_model(self, path: typing.Union[str, "os.PathLike"]) -> None:
+        """Saves fitted model, it can be passed as model to project other concepts.
+
+        Args:
+            path (typing.Union[str, os.PathLike]): output file
+        """
+        self.model.save(path)
 
     def _concept_df(self):
-        label_domain = self._concept.lattice._context._intents
-        vectors = list(
-            map(
-                lambda x: label_domain.__getitem__(x).bools(),
-                self._concept._extent.iter_set(),
-            )
-        )
+        view = concept_view(self._concept, axis=0)
 
         df = pd.DataFrame(
-            vectors,
+            view.rows,
             dtype=int,
-            index=self._concept.extent,
+            index=view.core,
             columns=self._concept.lattice._context.properties,
         )
 
         return df.loc[:, (df != 0).any(axis=0)]
 
-    def to_plotly(self) -> "go.Figure":
+    def _export_frame(self):
+        df = self.concept_df_transformed.rename(columns=lambda c: f"component_{c}")
+        return df.rename_axis("item").reset_index()
+
+    def to_plotly(self, webgl: bool = False, bins: int = None) -> "go.Figure":
         """Generates plotly figure.
 
+        Args:
+            webgl (bool, optional): if 2D scatter is rendered by WebGL (3D scatter always is). Defaults to False.
+            bins (int, optional): when specified, points are aggregated into bins x bins (x bins) grid cells, marker size shows number of objects in the cell. Defaults to None.
+
         Returns:
             go.Figure: figure
         """
 
+        import plotly.express as px
+
         # need some love
         data = self.concept_df_transformed.copy()
+        hover_names = list(
+            map(
+                lambda txt: "<br>".join(textwrap.wrap(str(txt), width=50)),
+                self.concept_df_transformed.index,
+            )
+        )
 
         hover_data = {
             "x": False,
@@ -68,9 +114,17 @@ class MCAConcept:
         else:
             color_name = None
 
-        if self.n_components == 3:
-            data = data.rename(columns={0: "x", 1: "y", 2: "z"})
+        data = data.rename(columns={0: "x", 1: "y", 2: "z"})
+        size = None
+
+        if bins is not None:
+            coordinates = ["x", "y", "z"] if self.n_components == 3 else ["x", "y"]
+            data = density_bins(data, coordinates, bins)
+            hover_names = [f"{count} objects" for count in data["count"]]
+            hover_data["count"] = True
+            size = "count"
 
+        if self.n_components == 3:
             hover_data["z"] = False
 
             fig = px.scatter_3d(
@@ -78,49 +132,46 @@ class MCAConcept:
                 x="x",
                 y="y",
                 z="z",
-                hover_name=list(
-                    map(
-                        lambda txt: "<br>".join(textwrap.wrap(str(txt), width=50)),
-                        self.concept_df_transformed.index,
-                    )
-                ),
+                hover_name=hover_names,
                 hover_data=hover_data,
                 color=color_name,
                 color_continuous_scale="Bluered",
+                size=size,
             )
         else:
-            data = data.rename(columns={0: "x", 1: "y"})
-
             fig = px.scatter(
                 data,
                 x="x",
                 y="y",
-                hover_name=list(
-                    map(
-                        lambda txt: "<br>".join(textwrap.wrap(str(txt), width=50)),
-                        self.concept_df_transformed.index,
-                    )
-                ),
+                hover_name=hover_names,
                 hover_data=hover_data,
                 color=color_name,
                 color_continuous_scale="Bluered",
+                size=size,
+                render_mode="webgl" if webgl else "auto",
             )
 
         return fig
 
     def to_plotly_html(
-        self, default_width: int = 700, default_height: int = 390
+        self,
+        default_width: int = 700,
+        default_height: int = 390,
+        webgl: bool = False,
+        bins: int = None,
     ) -> str:
         """Generates html version of plotly graph
 
         Args:
             default_width (int, optional): default graph width. Defaults to 700.
             default_height (int, optional): default graph height. Defaults to 390.
+            webgl (bool, optional): if 2D scatter is rendered by WebGL, see to_plotly. Defaults to False.
+            bins (int, optional): density bins per coordinate, see to_plotly. Defaults to None.
 
         Returns:
             str: graph html
         """
-        return self.to_plotly().to_html(
+        return self.to_plotly(webgl=webgl, bins=bins).to_html(
             full_html=False,
             include_plotlyjs="cdn",
             include_mathjax="cdn",
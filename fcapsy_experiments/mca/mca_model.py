@@ -0,0 +1,103 @@
+import pickle
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+class MCAModel:
+    def __init__(
+        self, mca: "prince.MCA", columns: typing.List[str], signs: "np.ndarray" = None
+    ) -> None:
+        """Fitted MCA which can project any concept with attributes from columns.
+
+        Args:
+            mca (prince.MCA): fitted MCA
+            columns (typing.List[str]): attributes the MCA was fitted on
+            signs (np.ndarray, optional): orientation of components. Defaults to None (all 1).
+        """
+        self.mca = mca
+        self.columns = list(columns)
+        self.signs = np.ones(mca.n_components) if signs is None else np.asarray(signs)
+
+    @property
+    def n_components(self) -> int:
+        return len(self.signs)
+
+    @classmethod
+    def fit(
+        cls,
+        df: "pd.DataFrame",
+        n_components: int = 2,
+        random_state: int = 42,
+        n_iter: int = 100,
+        previous: "MCAModel" = None,
+    ) -> "MCAModel":
+        """Fits MCA on object-attribute table.
+
+        When previous model is given, the new model is fitted on its attributes
+        together with attributes of df and components are oriented as in previous
+        model, so coordinates of both models stay comparable.
+
+        Args:
+            df (pd.DataFrame): binary object-attribute table
+            n_components (int, optional): number of components. Defaults to 2.
+            random_state (int, optional): random state of MCA. Defaults to 42.
+            n_iter (int, optional): number of iterations of MCA. Defaults to 100.
+            previous (MCAModel, optional): model which is refitted. Defaults to None.
+
+        Returns:
+            MCAModel: fitted model
+        """
+        import prince
+
+        columns = list(df.columns)
+
+        if previous is not None:
+            known = set(previous.columns)
+            columns = previous.columns + [c for c in columns if c not in known]
+
+        mca = prince.MCA(
+            n_components=n_components, random_state=random_state, n_iter=n_iter
+        )
+        mca.fit(df.reindex(columns=columns, fill_value=0))
+
+        model = cls(mca, columns)
+
+        if previous is not None:
+            shared = min(model.n_components, previous.n_components)
+            before = previous.transform(df).to_numpy()[:, :shared]
+            after = model.transform(df).to_numpy()[:, :shared]
+
+            # flip components pointing against the previous ones
+            model.signs[:shared] = np.where((before * after).sum(axis=0) < 0, -1, 1)
+
+        return model
+
+    def transform(self, df: "pd.DataFrame") -> "pd.DataFrame":
+        """Projects object-attribute table, missing attributes are treated as zeros.
+
+        Args:
+            df (pd.DataFrame): binary object-attribute table
+
+        Returns:
+            pd.DataFrame: coordinates, one column per component
+        """
+        coordinates = self.mca.transform(df.reindex(columns=self.columns, fill_value=0))
+
+        return pd.DataFrame(np.asarray(coordinates) * self.signs, index=df.index)
+
+    def save(self, path: typing.Union[str, "os.PathLike"]) -> None:
+        """Saves model into file."""
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @classmethod
+    def load(cls, path: typing.Union[str, "os.PathLike"]) -> "MCAModel":
+        """Loads model saved by save.
+
+        Models are pickled, loading a file can execute arbitrary code, so load
+        only trusted files.
+        """
+        with open(path, "rb") as f:
+            return pickle.load(f)
@@ -0,0 +1,188 @@
+import base64
+import html
+import json
+import typing
+import uuid
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy dtypes which plotly.js understands as typed arrays (dtype, bdata),
+# typed arrays need plotly.js 2.28 bundled since plotly 5.19
+_TYPED_ARRAYS = {
+    "float64": "f8",
+    "float32": "f4",
+    "int32": "i4",
+    "uint32": "u4",
+    "int16": "i2",
+    "uint16": "u2",
+    "int8": "i1",
+    "uint8": "u1",
+}
+
+
+def _pack_array(array):
+    """Binary packs numeric array as plotly.js typed array, other arrays become lists.
+
+    64-bit integers are packed as 32-bit ones when they fit, otherwise they are
+    kept exact in lists.
+    """
+    if array.dtype.kind in "iu" and array.dtype.itemsize == 8:
+        narrow = np.int32 if array.dtype.kind == "i" else np.uint32
+        info = np.iinfo(narrow)
+
+        if array.size and (array.min() < info.min or array.max() > info.max):
+            return array.tolist()
+
+        array = array.astype(narrow)
+
+    dtype = _TYPED_ARRAYS.get(array.dtype.name)
+
+    if dtype is None:
+        return array.tolist()
+
+    data = np.ascontiguousarray(array).tobytes()
+    packed = {"dtype": dtype, "bdata": base64.b64encode(data).decode("ascii")}
+
+    if array.ndim > 1:
+        packed["shape"] = ", ".join(map(str, array.shape))
+
+    return packed
+
+
+def _pack(value):
+    if isinstance(value, dict):
+        return {key: _pack(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_pack(item) for item in value]
+
+    if isinstance(value, np.ndarray):
+        return _pack_array(value)
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+def _default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return str(value)
+
+
+def dumps(value) -> str:
+    """Serializes plotly json, uses orjson when installed."""
+    value = _pack(value)
+
+    if orjson is not None:
+        dumped = orjson.dumps(
+            value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    else:
+        dumped = json.dumps(value, default=_default, separators=(",", ":"))
+
+    # figure json is embedded in <script>
+    return dumped.replace("</", "<\\/")
+
+
+class Report:
+    def __init__(self, title: str = None) -> None:
+        """Collects figures of multiple experiments into single self-contained html.
+
+        Args:
+            title (str, optional): title of the report. Defaults to None.
+        """
+        self.title = title
+        self._figures = []
+
+    def add(
+        self,
+        item: typing.Union["go.Figure", typing.Any],
+        title: str = None,
+        default_width: int = 700,
+        default_height: int = 390,
+    ) -> "Report":
+        """Adds figure to the report.
+
+        Args:
+            item (typing.Union[go.Figure, typing.Any]): plotly figure or experiment with to_plotly method
+            title (str, optional): heading of the figure. Defaults to None.
+            default_width (int, optional): figure width. Defaults to 700.
+            default_height (int, optional): figure height. Defaults to 390.
+
+        Returns:
+            Report: self
+        """
+        figure = item.to_plotly() if hasattr(item, "to_plotly") else item
+
+        self._figures.append((figure, title, default_width, default_height))
+
+        return self
+
+    def _iter_html(self):
+        from plotly.offline import get_plotlyjs
+
+        yield '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8" />\n'
+
+        if self.title is not None:
+            yield f"<title>{html.escape(self.title)}</title>\n"
+
+        yield '<script type="text/javascript">'
+        yield get_plotlyjs()
+        yield "</script>\n</head>\n<body>\n"
+
+        if self.title is not None:
+            yield f"<h1>{html.escape(self.title)}</h1>\n"
+
+        for figure, title, width, height in self._figures:
+            div_id = str(uuid.uuid4())
+            figure_json = figure.to_plotly_json()
+
+            if title is not None:
+                yield f"<h2>{html.escape(title)}</h2>\n"
+
+            yield (
+                f'<div id="{div_id}" class="plotly-graph-div" '
+                f'style="width:{width}px; height:{height}px;"></div>\n'
+            )
+            yield '<script type="text/javascript">Plotly.newPlot("{}", {}, {}, {});</script>\n'.format(
+                div_id,
+                dumps(figure_json.get("data", [])),
+                dumps(figure_json.get("layout", {})),
+                dumps({"responsive": True}),
+            )
+
+        yield "</body>\n</html>\n"
+
+    def to_html(self) -> str:
+        """Generates self-contained html of the report.
+
+        Returns:
+            str: html output
+        """
+        return "".join(self._iter_html())
+
+    def write(self, file: typing.Union[str, "os.PathLike", typing.TextIO]) -> None:
+        """Writes self-contained html of the report in single streaming pass.
+
+        Args:
+            file (typing.Union[str, os.PathLike, typing.TextIO]): path or opened text file
+        """
+        if hasattr(file, "write"):
+            for chunk in self._iter_html():
+                file.write(chunk)
+            return
+
+        with open(file, "w", encoding="utf-8") as f:
+            for chunk in self._iter_html():
+                f.write(chunk)
@@ -1,3 +1,11 @@
-from .concept_typicality import ConceptTypicality
-from .top_r_similarity import TopRSimilarity
-from .top_bottom_r_similarity import TopBottomRSimilarity
+from fcapsy_experiments._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "ConceptTypicality": ".concept_typicality",
+        "TopRSimilarity": ".top_r_similarity",
+        "TopBottomRSimilarity": ".top_bottom_r_similarity",
+        "TypicalityBootstrap": ".bootstrap",
+    },
+)
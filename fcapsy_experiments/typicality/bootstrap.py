@@ -0,0 +1,140 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+from binsdpy.similarity import jaccard, smc, russell_rao
+
+from fcapsy_experiments._concept_view import concept_view
+from fcapsy_experiments._similarity import pairwise_similarity
+
+
+class TypicalityBootstrap:
+    def __init__(
+        self,
+        concept: "concepts.lattices.Concept",
+        axis: int = 0,
+        similarities: dict[str, typing.Callable] = None,
+        n_replicates: int = 200,
+        confidence: float = 0.95,
+        n_jobs: int = 1,
+        random_state: int = None,
+    ) -> None:
+        """Bootstrap stability of typicality_avg rankings under resampling of context objects.
+
+        Objects of the context are resampled with replacement, replicates reweight
+        cached pairwise statistics instead of rebuilding the context. For objects (axis 0)
+        the similarity matrix of the extent is computed once and every replicate is
+        weighted average of its rows, for attributes (axis 1) contingency counts are
+        recomputed as weighted sums over objects.
+
+        Args:
+            concept (concepts.lattices.Concept): in which concept the typicality is calculated
+            axis (int, optional): if typicality is calculated for objects (0) or attributes (1). Defaults to 0.
+            similarities (dict[str, typing.Callable], optional): jaccard, smc or russell_rao similarities by label. Defaults to None (J, SMC and R).
+            n_replicates (int, optional): number of bootstrap replicates. Defaults to 200.
+            confidence (float, optional): confidence level of rank intervals. Defaults to 0.95.
+            n_jobs (int, optional): number of threads computing replicates. Defaults to 1.
+            random_state (int, optional): seed of resampling. Defaults to None.
+        """
+        if similarities is None:
+            similarities = {"J": jaccard, "SMC": smc, "R": russell_rao}
+
+        self._concept = concept
+        self._view = concept_view(concept, axis)
+        self._similarities = {
+            f"typ_avg({name})": similarity for name, similarity in similarities.items()
+        }
+
+        context = concept.lattice._context
+        self._n_objects = len(context.objects)
+
+        if axis == 0:
+            rows = self._view.rows
+            self._similarity_matrices = {
+                column: pairwise_similarity(rows, rows, similarity)
+                for column, similarity in self._similarities.items()
+            }
+        elif axis == 1:
+            # attribute extents over all objects, coordinates are resampled objects
+            self._extents = self._view.rows
+        else:
+            raise ValueError("Invalid axis index")
+
+        self.axis = axis
+        self.n_replicates = n_replicates
+        self.confidence = confidence
+
+        seeds = np.random.SeedSequence(random_state).spawn(n_replicates)
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            replicates = list(executor.map(self._replicate, seeds))
+
+        items = list(self._view.core)
+
+        # replicate ranks per typicality column, rows are replicates
+        self.replicates = {
+            column: pd.DataFrame([ranks[column] for ranks in replicates], columns=items)
+            for column in self._similarities
+        }
+
+        self.df = self._init(items)
+
+    def _typicality(self, weights):
+        """Typicality of core items for given object weights.
+
+        Similarity row of an object does not depend on whether the object was
+        drawn, so every core item is ranked in every replicate.
+
+        Returns:
+            dict: typicality values by column, NaN when no core object was drawn
+        """
+        if self.axis == 0:
+            core_weights = weights[self._view.indices]
+            total = core_weights.sum()
+
+            return {
+                column: matrix @ core_weights / total
+                if total > 0
+                else np.full(len(matrix), np.nan)
+                for column, matrix in self._similarity_matrices.items()
+            }
+
+        return {
+            column: pairwise_similarity(
+                self._extents, self._extents, similarity, weights=weights
+            ).mean(axis=1)
+            for column, similarity in self._similarities.items()
+        }
+
+    @staticmethod
+    def _ranks(values):
+        # rank 1 is the most typical item, ties get average rank
+        return pd.Series(values).rank(ascending=False, method="average").to_numpy()
+
+    def _replicate(self, seed):
+        rng = np.random.default_rng(seed)
+        weights = rng.multinomial(
+            self._n_objects, np.full(self._n_objects, 1 / self._n_objects)
+        ).astype(float)
+
+        return {
+            column: self._ranks(values)
+            for column, values in self._typicality(weights).items()
+        }
+
+    def _init(self, items):
+        full = self._typicality(np.ones(self._n_objects))
+        tail = (1 - self.confidence) / 2 * 100
+
+        df = pd.DataFrame(index=items)
+
+        for column in self._similarities:
+            ranks = self.replicates[column].to_numpy(dtype=float)
+
+            df[f"{column} rank"] = self._ranks(full[column])
+            df[f"{column} lower"] = np.nanpercentile(ranks, tail, axis=0)
+            df[f"{column} upper"] = np.nanpercentile(ranks, 100 - tail, axis=0)
+
+        return df
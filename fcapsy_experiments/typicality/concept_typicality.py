@@ -1,16 +1,34 @@
 import itertools
+import math
+import typing
 
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 
-from sklearn.preprocessing import MinMaxScaler
 from fcapsy.typicality import typicality_avg
 from binsdpy.similarity import jaccard, smc, russell_rao
-
+from statistics import NormalDist
+
+from fcapsy_experiments._async import AsyncMixin
+from fcapsy_experiments._concept_view import concept_view
+from fcapsy_experiments._export import ExportMixin
+from fcapsy_experiments._html import (
+    iter_table,
+    rows_slice,
+    styler_gradient,
+    write_table,
+)
+from fcapsy_experiments._plotting import lttb
+from fcapsy_experiments._similarity import (
+    is_vectorized,
+    blocked_row_means,
+    blocked_row_sums,
+    iter_tiles,
+)
 from fcapsy_experiments._styles import css, css_typ
 
 
-class ConceptTypicality:
+class ConceptTypicality(AsyncMixin, ExportMixin):
     count_label = "Count"
 
     def __init__(
@@ -20,6 +38,11 @@ class ConceptTypicality:
         count: bool = False,
         extra_columns: dict[str, "pd.Series"] = None,
         typicality_functions: dict[str, dict] = None,
+        max_memory: int = None,
+        sample_size: int = None,
+        target_error: float = None,
+        confidence: float = 0.95,
+        random_state: int = None,
     ) -> None:
         """Calculates typiclity for given concept
 
@@ -29,8 +52,22 @@ class ConceptTypicality:
             count (bool, optional): if count of attributes/objects should be included as column. Defaults to False.
             extra_columns (dict[str, pandas.Series], optional): extra columns to be included in the table. Defaults to None.
             typicality_functions (dict[str, dict], optional): when specified, user can modify default functions which is used for typicality calculation, see default example. Defaults to None.
+            max_memory (int, optional): when specified, typicality_avg with jaccard, smc or russell_rao is computed in blocked mode, single similarity tile together with float copies of its rows uses at most max_memory bytes. Defaults to None.
+            sample_size (int, optional): when specified, typicality_avg is estimated from random sample of the concept core of this size, see confidence_intervals. Defaults to None.
+            target_error (float, optional): when specified (and sample_size is not), sample size is chosen so the confidence interval half-width is at most target_error. Defaults to None.
+            confidence (float, optional): confidence level of the intervals of sampled estimates. Defaults to 0.95.
+            random_state (int, optional): seed of the sample. Defaults to None.
         """
 
+        if sample_size is not None and sample_size < 1:
+            raise ValueError("Sample size must be positive.")
+
+        if target_error is not None and target_error <= 0:
+            raise ValueError("Target error must be positive.")
+
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be in (0, 1).")
+
         if typicality_functions is None:
             # default typicality configuration
             typicality_functions = {
@@ -46,21 +83,22 @@ class ConceptTypicality:
             }
 
         self._concept = concept
-        context = self._concept.lattice._context
-
-        if axis == 0:
-            self._items_domain = context.objects
-            self._items_sets = context._intents
-            self._concept_core = self._concept.extent
-        elif axis == 1:
-            self._items_domain = context.properties
-            self._items_sets = context._extents
-            self._concept_core = self._concept.intent
-        else:
-            raise ValueError("Invalid axis index")
+        self._view = concept_view(concept, axis)
 
-        self.axis = axis
+        self._items_domain = self._view.items_domain
+        self._items_sets = self._view.items_sets
+        self._concept_core = self._view.core
 
+        self.axis = axis
+        self.max_memory = max_memory
+        self.sample_size = sample_size
+        self.target_error = target_error
+        self.confidence = confidence
+        self.random_state = random_state
+        self.confidence_intervals = None
+
+        # state of incremental updates, initialized by first update
+        self._sums = None
         self.df = self._init(concept, count, typicality_functions, extra_columns)
 
         if extra_columns:
@@ -68,43 +106,129 @@ class ConceptTypicality:
 
         self.extra_columns = extra_columns
 
-    def _init(self, concept, count, typicality_functions, extra_columns):
+    @staticmethod
+    def _columns(typicality_functions):
         columns = []
 
         for name, typicality in typicality_functions.items():
+            function = typicality["func"]
+
             if typicality["args"]:
-                for arg in typicality["args"].keys():
-                    columns.append(f"{name}({arg})")
+                for arg_name, arg in typicality["args"].items():
+                    columns.append((f"{name}({arg_name})", function, arg))
             else:
-                columns.append(f"{name}")
+                columns.append((f"{name}", function, {}))
 
-        df = pd.DataFrame(index=self._concept_core, columns=columns, dtype=float)
+        return columns
 
-        for item in self._concept_core:
-            row = []
+    @staticmethod
+    def _is_average(function, arg):
+        return function is typicality_avg and set(arg) == {"similarity"}
 
-            for typicality in typicality_functions.values():
-                function = typicality["func"]
-                args = typicality["args"].values()
+    @property
+    def _is_sampled(self):
+        return self.sample_size is not None or self.target_error is not None
 
-                if args:
-                    for _, arg in typicality["args"].items():
-                        row.append(function(item, concept, **arg))
-                else:
-                    row.append(function(item, concept))
+    def _is_blocked(self, function, arg):
+        return (
+            self.max_memory is not None
+            and self._is_average(function, arg)
+            and is_vectorized(arg["similarity"])
+        )
 
-            df.loc[item] = row
+    def _z_score(self):
+        return NormalDist().inv_cdf(0.5 + self.confidence / 2)
 
-        if count:
-            counts = (extent.bits().count("1") for extent in self._items_sets)
+    def _sample(self):
+        population = len(self._concept_core)
+        size = self.sample_size
 
-            df[self.count_label] = [
-                row[1]
-                for row in filter(
-                    lambda x: x[0] in self._concept_core,
-                    zip(self._items_domain, counts),
-                )
-            ]
+        if size is None:
+            # similarities are from [0, 1], their standard deviation is at most 0.5
+            size = (self._z_score() * 0.5 / self.target_error) ** 2
+            size = math.ceil(size / (1 + (size - 1) / max(1, population)))
+
+        rng = np.random.default_rng(self.random_state)
+
+        return rng.choice(population, size=min(size, population), replace=False)
+
+    def _sampled_typicality(self, similarity, sample):
+        """Estimates average similarity to the concept core from its sample.
+
+        Returns:
+            tuple: point estimates, lower and upper bounds of confidence intervals
+        """
+        core = self._view.core_sets
+        sample_sets = [core[idx] for idx in sample]
+
+        sums = np.zeros(len(core))
+        squares = np.zeros(len(core))
+
+        if is_vectorized(similarity):
+            rows = self._view.rows
+            tiles = iter_tiles(rows, rows[sample], similarity, self.max_memory)
+        else:
+            tiles = (
+                (idx, idx + 1, np.array([[similarity(item, s) for s in sample_sets]]))
+                for idx, item in enumerate(core)
+            )
+
+        # tiles may cover only part of the sample, moments are accumulated
+        for start, stop, tile in tiles:
+            sums[start:stop] += tile.sum(axis=1)
+            squares[start:stop] += np.square(tile).sum(axis=1)
+
+        means = sums / len(sample)
+        stds = np.zeros(len(core))
+
+        if len(sample) > 1:
+            variances = (squares - sums * means) / (len(sample) - 1)
+            stds = np.sqrt(np.maximum(variances, 0))
+
+        population = len(core)
+        # finite population correction, sample is drawn without replacement
+        correction = math.sqrt((population - len(sample)) / max(1, population - 1))
+        half_width = (
+            self._z_score() * stds / math.sqrt(max(1, len(sample))) * correction
+        )
+
+        return means, means - half_width, means + half_width
+
+    def _blocked_typicality(self, similarity):
+        core = self._view.rows
+
+        return blocked_row_means(core, core, similarity, self.max_memory)
+
+    def _init(self, concept, count, typicality_functions, extra_columns):
+        columns = self._columns(typicality_functions)
+        self._typicality_columns = columns
+
+        df = pd.DataFrame(
+            index=self._concept_core,
+            columns=[column for column, _, _ in columns],
+            dtype=float,
+        )
+
+        if self._is_sampled:
+            sample = self._sample()
+            self.confidence_intervals = pd.DataFrame(index=self._concept_core)
+
+        for column, function, arg in columns:
+            if self._is_sampled and self._is_average(function, arg):
+                (
+                    df[column],
+                    self.confidence_intervals[f"{column} lower"],
+                    self.confidence_intervals[f"{column} upper"],
+                ) = self._sampled_typicality(arg["similarity"], sample)
+            elif self._is_blocked(function, arg):
+                df[column] = self._blocked_typicality(arg["similarity"])
+            else:
+                df[column] = [
+                    function(item, concept, **arg) for item in self._concept_core
+                ]
+
+        if count:
+            df[self.count_label] = self._view.rows.sum(axis=1)
 
         if extra_columns:
             for name, values in extra_columns.items():
@@ -112,12 +236,172 @@ class ConceptTypicality:
 
         return df
 
-    def to_html(self) -> str:
+    def update(
+        self,
+        added_objects: dict[str, typing.Iterable[str]] = None,
+        removed_objects: typing.Iterable[str] = None,
+    ) -> None:
+        """Updates the table after objects were added to or removed from the concept extent.
+
+        Cached sums of similarities are adjusted only by similarities to changed
+        objects, so the cost is proportional to the size of the change times the
+        extent size. Results are equal to a full recomputation (up to floating point
+        summation order). Supported only for objects (axis 0) and typicality_avg
+        with jaccard, smc or russell_rao.
+
+        After the update the table no longer describes a concept of the lattice,
+        so the cached view of the concept is dropped.
+
+        Args:
+            added_objects (dict[str, typing.Iterable[str]], optional): new extent objects mapped to their attributes. Defaults to None.
+            removed_objects (typing.Iterable[str], optional): objects which left the extent. Defaults to None.
+        """
+        if self.axis != 0:
+            raise ValueError("Incremental update is supported only for objects.")
+
+        if self._is_sampled:
+            raise ValueError("Incremental update is not supported for sampled mode.")
+
+        for column, function, arg in self._typicality_columns:
+            if not self._is_average(function, arg) or not is_vectorized(
+                arg["similarity"]
+            ):
+                raise ValueError(f"Column {column} cannot be updated incrementally.")
+
+        added_objects = dict(added_objects or {})
+        removed = set(removed_objects or ())
+
+        if self._sums is None:
+            self._items = list(self._concept_core)
+            self._rows = self._view.rows
+            self._sums = {
+                column: blocked_row_sums(
+                    self._rows, self._rows, arg["similarity"], self.max_memory
+                )
+                for column, _, arg in self._typicality_columns
+            }
+
+        unknown = removed.difference(self._items)
+
+        if unknown:
+            raise ValueError(f"Objects {sorted(unknown)} are not in the extent.")
+
+        duplicate = set(added_objects).intersection(self._items).difference(removed)
+
+        if duplicate:
+            raise ValueError(f"Objects {sorted(duplicate)} are already in the extent.")
+
+        properties = self._concept.lattice._context.properties
+        positions = {prop: idx for idx, prop in enumerate(properties)}
+
+        unknown = {
+            attribute
+            for attributes in added_objects.values()
+            for attribute in attributes
+            if attribute not in positions
+        }
+
+        if unknown:
+            raise ValueError(f"Attributes {sorted(unknown)} are not in the context.")
+
+        added_rows = np.zeros((len(added_objects), len(properties)), dtype=bool)
+
+        for row, attributes in zip(added_rows, added_objects.values()):
+            row[[positions[attribute] for attribute in attributes]] = True
+
+        keep = np.array([item not in removed for item in self._items], dtype=bool)
+        removed_rows = self._rows[~keep]
+        kept_rows = self._rows[keep]
+        rows = np.concatenate([kept_rows, added_rows])
+
+        for column, _, arg in self._typicality_columns:
+            similarity = arg["similarity"]
+            sums = self._sums[column][keep]
+
+            if len(removed_rows):
+                sums -= blocked_row_sums(
+                    kept_rows, removed_rows, similarity, self.max_memory
+                )
+
+            if len(added_rows):
+                sums += blocked_row_sums(
+                    kept_rows, added_rows, similarity, self.max_memory
+                )
+
+            self._sums[column] = np.concatenate(
+                [sums, blocked_row_sums(added_rows, rows, similarity, self.max_memory)]
+            )
+
+        self._items = [item for item, kept in zip(self._items, keep) if kept] + list(
+            added_objects
+        )
+        self._rows = rows
+
+        df = pd.DataFrame(index=self._items)
+
+        for column, _, _ in self._typicality_columns:
+            df[column] = self._sums[column] / len(self._items)
+
+        for column in self.df.columns[len(self._typicality_columns) :]:
+            if column == self.count_label:
+                df[column] = rows.sum(axis=1)
+            else:
+                # extra columns are not known for added objects
+                df[column] = self.df[column].reindex(df.index)
+
+        self.df = df
+        self._concept_core = tuple(self._items)
+
+        # they describe the concept before the update
+        self._view = self._items_domain = self._items_sets = None
+
+    def _export_frame(self):
+        return self.df.rename_axis("item").reset_index()
+
+    def _sorted_columns(self):
+        """Every column sorted descending (as in Styler path), paired with item order."""
+        index = self.df.index.to_numpy(dtype=object)
+
+        columns = []
+
+        for column in self.df.columns:
+            values = self.df[column].reset_index(drop=True)
+            # stable sort keeps ties in original order, missing values are last
+            order = values.sort_values(ascending=False, kind="mergesort").index
+
+            columns.append((f"{column} order", index[order]))
+            columns.append((column, values.to_numpy()[order]))
+
+        return columns
+
+    def to_html(
+        self,
+        fast: bool = False,
+        top_n: int = None,
+        page: int = 0,
+        page_size: int = None,
+        buf: "typing.TextIO" = None,
+    ) -> typing.Optional[str]:
         """Generates html table.
 
+        Args:
+            fast (bool, optional): if table is rendered by vectorized renderer instead of pandas Styler. Defaults to False.
+            top_n (int, optional): only top_n rows are included. Defaults to None.
+            page (int, optional): which page is rendered when page_size is specified. Defaults to 0.
+            page_size (int, optional): number of rows per page. Defaults to None.
+            buf (typing.TextIO, optional): when specified (only with fast), html is streamed into buf and None is returned. Defaults to None.
+
         Returns:
-            str: html output
+            typing.Optional[str]: html output
         """
+        rows = rows_slice(top_n, page, page_size)
+
+        if fast:
+            chunks = iter_table(
+                self._sorted_columns(), styles=css + css_typ, precision=3, rows=rows
+            )
+            return write_table(chunks, buf)
+
         final_table = pd.DataFrame()
 
         for column in self.df.columns:
@@ -128,21 +412,28 @@ class ConceptTypicality:
             final_table[f"{column} order"] = round_and_sort.index
             final_table[column] = round_and_sort.reset_index()[column]
 
-        df = final_table.reset_index().drop("index", axis=1)
+        final_table = final_table.reset_index().drop("index", axis=1)
 
-        df = df.style.format(precision=3)
-        df.background_gradient(cmap="RdYlGn")
+        df = final_table.iloc[rows].style.format(precision=3)
+        styler_gradient(df, final_table)
         df.set_table_styles(css + css_typ)
-        df.hide_index()
+        df.hide(axis="index")
 
         return df.to_html()
 
-    def to_plotly(self) -> "go.Figure":
+    def to_plotly(self, webgl: bool = False, max_points: int = None) -> "go.Figure":
         """Generates plotly figure.
 
+        Args:
+            webgl (bool, optional): if WebGL traces (go.Scattergl) are used. Defaults to False.
+            max_points (int, optional): when specified, every column is downsampled by LTTB to max_points, union of kept items is plotted. Defaults to None.
+
         Returns:
             go.Figure: figure
         """
+        import plotly.graph_objects as go
+        from sklearn.preprocessing import MinMaxScaler
+
         markers = ["square", "diamond", "triangle-up", "circle", "pentagon"]
 
         scatters = []
@@ -159,9 +450,20 @@ class ConceptTypicality:
                 scaler = MinMaxScaler()
                 df[extra] = scaler.fit_transform(df[extra].values.reshape(-1, 1))
 
+        if max_points is not None:
+            positions = np.arange(len(df))
+            keep = set()
+
+            for column in df.columns:
+                keep.update(lttb(positions, df[column].to_numpy(), max_points))
+
+            df = df.iloc[sorted(keep)]
+
+        trace = go.Scattergl if webgl else go.Scatter
+
         for column, marker in zip(df.columns, itertools.cycle(markers)):
             scatters.append(
-                go.Scatter(
+                trace(
                     name=column,
                     x=df.index,
                     y=df[column],
@@ -212,18 +514,24 @@ class ConceptTypicality:
         return fig
 
     def to_plotly_html(
-        self, default_width: int = 700, default_height: int = 390
+        self,
+        default_width: int = 700,
+        default_height: int = 390,
+        webgl: bool = False,
+        max_points: int = None,
     ) -> str:
         """Generates html version of plotly graph
 
         Args:
             default_width (int, optional): default graph width. Defaults to 700.
             default_height (int, optional): default graph height. Defaults to 390.
+            webgl (bool, optional): if WebGL traces are used, see to_plotly. Defaults to False.
+            max_points (int, optional): downsampling threshold, see to_plotly. Defaults to None.
 
         Returns:
             str: graph html
         """
-        return self.to_plotly().to_html(
+        return self.to_plotly(webgl=webgl, max_points=max_points).to_html(
             full_html=False,
             include_plotlyjs="cdn",
             include_mathjax="cdn",
@@ -1,5 +1,6 @@
 import typing
 
+import numpy as np
 import pandas as pd
 
 from itertools import combinations
@@ -8,12 +9,13 @@ from .top_r_similarity import TopRSimilarity
 
 
 class TopBottomRSimilarity(TopRSimilarity):
+    # values are products of top r and bottom r curves
+    _curves = 2
+
     @staticmethod
     def _init(inst, to_columns):
         r_range = range(1, len(inst._source.index))
 
-        results = []
-
         # filtered_columns = filter(
         #     lambda c: c not in ignore_columns, inst._source.columns
         # )
@@ -23,13 +25,39 @@ class TopBottomRSimilarity(TopRSimilarity):
             [(x, y) for x in inst._source.columns for y in to_columns if x != y],
         )
 
-        for (column1_order, column2_order), label in zip(columns_tuples, labels):
+        values = np.empty((len(labels), len(r_range)), dtype=np.float32)
+
+        if inst._lsh is not None:
+            errors = np.empty_like(values)
+
+            for row, (column1_order, column2_order) in enumerate(columns_tuples):
+                top_r, top_r_errors = inst._approximate_top_r_similarity(
+                    inst, column1_order, column2_order, r_range
+                )
+                bottom_r, bottom_r_errors = inst._approximate_top_r_similarity(
+                    inst, column1_order[::-1], column2_order[::-1], r_range
+                )
+
+                values[row] = np.multiply(top_r, bottom_r)
+                # error of product of two values from [0, 1]
+                errors[row] = np.add(top_r_errors, bottom_r_errors)
+
+            return inst._results_frame(
+                r_range, values, labels, "top_bottom_r_similarity", errors
+            )
+
+        for row, (column1_order, column2_order) in enumerate(columns_tuples):
             column1_order_reversed = column1_order[::-1]
             column2_order_reversed = column2_order[::-1]
 
-            for r in r_range:
+            for column, r in enumerate(r_range):
                 top_r = inst._top_r_similarity(
-                    inst._context, inst._similarity, column1_order, column2_order, r
+                    inst._context,
+                    inst._similarity,
+                    column1_order,
+                    column2_order,
+                    r,
+                    inst._max_memory,
                 )
                 bottom_r = inst._top_r_similarity(
                     inst._context,
@@ -37,13 +65,8 @@ class TopBottomRSimilarity(TopRSimilarity):
                     column1_order_reversed,
                     column2_order_reversed,
                     r,
+                    inst._max_memory,
                 )
-                results.append(
-                    [
-                        r,
-                        top_r * bottom_r,
-                        label,
-                    ]
-                )
+                values[row, column] = top_r * bottom_r
 
-        return pd.DataFrame(results, columns=["r", "top_bottom_r_similarity", "label"])
+        return inst._results_frame(r_range, values, labels, "top_bottom_r_similarity")
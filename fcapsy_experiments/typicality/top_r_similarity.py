@@ -1,20 +1,137 @@
+import heapq
+import math
 import typing
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 
 from statistics import mean
 from itertools import combinations
 from binsdpy.similarity import jaccard
 
+from fcapsy_experiments._export import ExportMixin
+from fcapsy_experiments._minhash import MinHashLSH, LSHIndex
+from fcapsy_experiments._plotting import lttb
+from fcapsy_experiments._similarity import (
+    is_vectorized,
+    to_bools,
+    blocked_row_max,
+    pairwise_similarity,
+)
+
+
+def _sample_size(error, delta):
+    """Sample size whose Hoeffding bound of the mean of [0, 1] values is error."""
+    return math.ceil(math.log(2 / delta) / (2 * error**2))
+
+
+def _sampling_error(sample_size, population, delta):
+    """Hoeffding-Serfling bound of the error of mean of sample without replacement.
+
+    Mean of sample_size values from [0, 1] differs from mean of the population
+    by more than the bound with probability at most delta.
+    """
+    if sample_size >= population:
+        return 0.0
+
+    correction = 1 - (sample_size - 1) / population
+
+    return math.sqrt(correction * math.log(2 / delta) / (2 * sample_size))
+
+
+class _PrefixSample:
+    def __init__(self, lsh, rows, priorities, size):
+        """Growing prefix of an order with uniform random sample of its items.
+
+        Sample are (at most size) items with the lowest priorities, best similarity
+        of every sampled item to the other prefix is kept up to date.
+        """
+        self._lsh = lsh
+        self._rows = rows
+        self._priorities = priorities
+        self._size = size
+        self._index = LSHIndex(lsh)
+        self._heap = []
+
+        self.items = []
+        self.best = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def _similarities(self, item, others):
+        return pairwise_similarity(self._rows[[item]], self._rows[others], jaccard)[0]
+
+    def nearest(self, item) -> float:
+        """Highest similarity between item and items of prefix.
+
+        LSH candidates are used when some of them reaches lsh.recall_similarity
+        (more similar item is missed with probability at most lsh.miss_probability),
+        otherwise whole prefix is scanned.
+        """
+        candidates = self._index.candidates(item)
+
+        if candidates.size:
+            best = self._similarities(item, candidates).max()
+
+            if best >= self._lsh.recall_similarity:
+                return best
+
+        if not self.items:
+            return 0.0
+
+        return self._similarities(item, self.items).max()
+
+    def add(self, item, other: "_PrefixSample") -> None:
+        """Appends item to prefix, other is the prefix of the other order."""
+        other.update(item)
+
+        self.items.append(item)
+        self._index.add(item)
+
+        priority = self._priorities[item]
+
+        if len(self.best) < self._size or priority < -self._heap[0][0]:
+            self.best[item] = other.nearest(item)
+            heapq.heappush(self._heap, (-priority, item))
+
+            if len(self.best) > self._size:
+                _, evicted = heapq.heappop(self._heap)
+                del self.best[evicted]
+
+    def update(self, item) -> None:
+        """Updates best similarities of sampled items by item added to the other prefix."""
+        if not self.best:
+            return
+
+        sampled = list(self.best)
+
+        for key, similarity in zip(sampled, self._similarities(item, sampled)):
+            if similarity > self.best[key]:
+                self.best[key] = similarity
+
+    def mean(self) -> float:
+        return sum(self.best.values()) / len(self.best)
+
+    def error(self, delta) -> float:
+        return _sampling_error(len(self.best), len(self.items), delta)
+
+
+class TopRSimilarity(ExportMixin):
+    # approximate curves combined into single value, they share failure probability
+    _curves = 1
 
-class TopRSimilarity:
     def __init__(
         self,
         source: "pd.DataFrame",
         context: "concepts.Context",
         similarity: typing.Callable = jaccard,
         to_columns: typing.List[str] = None,
+        max_memory: int = None,
+        approximate: bool = False,
+        error: float = 0.05,
+        confidence: float = 0.95,
+        seed: int = None,
     ) -> None:
         """Calculates TopR similarities for given dataframe.
 
@@ -23,13 +140,47 @@ class TopRSimilarity:
             context (concepts.Context): source formal context
             similarity (typing.Callable, optional): similarity which should be used. Defaults to jaccard.
             to_columns (typing.List[str], optional): which columns to compare every other from source dataframe. Defaults to None (means all).
+            max_memory (int, optional): when specified and similarity is jaccard, smc or russell_rao, similarities are computed in blocked mode, single similarity tile together with float copies of its rows uses at most max_memory bytes. Defaults to None.
+            approximate (bool, optional): if similarities are estimated from random samples of prefixes with MinHash LSH nearest neighbour search (jaccard only), bound of the error of every value is reported in "error" column. Defaults to False.
+            error (float, optional): error bound of values of large prefixes used when approximate, smaller prefixes are sampled whole and their error is lower. Defaults to 0.05.
+            confidence (float, optional): probability with which every approximate value is within its error bound. Defaults to 0.95.
+            seed (int, optional): seed of samples and MinHash functions used when approximate. Defaults to None.
         """
         if to_columns is None:
             to_columns = source.columns
 
+        if approximate and similarity is not jaccard:
+            raise ValueError("Approximate mode supports only jaccard similarity.")
+
+        if approximate and not 0 < error < 1:
+            raise ValueError("Error must be in (0, 1).")
+
+        if approximate and not 0 < confidence < 1:
+            raise ValueError("Confidence must be in (0, 1).")
+
         self._similarity = similarity
         self._source = source
         self._context = context
+        self._max_memory = max_memory
+        self._lsh = None
+
+        if approximate:
+            label_domain, domain = self._get_domain(context, source.index)
+            lsh_seed, sample_seed = np.random.SeedSequence(seed).spawn(2)
+
+            # failure probability of single curve, half for sampling of both
+            # prefixes, half for LSH misses of at most 2 * sample size sampled items
+            self._delta = (1 - confidence) / self._curves
+            self._sample_size = _sample_size(error, self._delta / 4)
+            self._rows = to_bools(label_domain)
+            self._lsh = MinHashLSH(
+                self._rows,
+                miss_probability=self._delta / 2 / (2 * self._sample_size),
+                seed=lsh_seed,
+            )
+            self._priorities = np.random.default_rng(sample_seed).random(len(domain))
+            self._positions = {item: idx for idx, item in enumerate(domain)}
+
         self.df = self._init(self, to_columns)
 
     @staticmethod
@@ -66,7 +217,69 @@ class TopRSimilarity:
         return results, labels
 
     @staticmethod
-    def _top_r_similarity(context, similarity, metric_1_order, metric_2_order, r):
+    def _get_domain(context, items):
+        if len(items) and items[0] in context.properties:
+            return context._extents, context.properties
+
+        return context._intents, context.objects
+
+    @staticmethod
+    def _prefix_length(order, r):
+        """Length of list(_r_values_or_until_differs(order, r)) for r > 0."""
+        idx = min(r, len(order)) - 1
+
+        while idx < len(order) - 1 and order[idx] == order[idx + 1]:
+            idx += 1
+
+        return idx + 1
+
+    @staticmethod
+    def _approximate_top_r_similarity(inst, metric_1_order, metric_2_order, r_range):
+        """Estimates top r similarity for every r from r_range in single pass.
+
+        Prefixes of both orders only grow with r. Every prefix keeps uniform random
+        sample of its items (see _PrefixSample) with their best similarity to the
+        other prefix, values are estimated from means of the samples. Best
+        similarity of newly sampled item is searched among its LSH candidates, the
+        other prefix is scanned only when none of them is similar enough. For
+        sample size k the pass evaluates O(k n log n) similarities instead of O(n^2).
+
+        Returns:
+            tuple: values and bounds of their errors, each holds with probability
+            at least 1 - inst._delta
+        """
+        order_1 = [inst._positions[item] for item in metric_1_order]
+        order_2 = [inst._positions[item] for item in metric_2_order]
+
+        prefix_1, prefix_2 = (
+            _PrefixSample(inst._lsh, inst._rows, inst._priorities, inst._sample_size)
+            for _ in range(2)
+        )
+
+        values, errors = [], []
+
+        for r in r_range:
+            length_1 = TopRSimilarity._prefix_length(order_1, r)
+            length_2 = TopRSimilarity._prefix_length(order_2, r)
+
+            while len(prefix_1) < length_1:
+                prefix_1.add(order_1[len(prefix_1)], prefix_2)
+
+            while len(prefix_2) < length_2:
+                prefix_2.add(order_2[len(prefix_2)], prefix_1)
+
+            # error of minimum is at most the larger error of both means
+            values.append(min(prefix_1.mean(), prefix_2.mean()))
+            errors.append(
+                max(prefix_1.error(inst._delta / 4), prefix_2.error(inst._delta / 4))
+            )
+
+        return values, errors
+
+    @staticmethod
+    def _top_r_similarity(
+        context, similarity, metric_1_order, metric_2_order, r, max_memory=None
+    ):
         def _get_vectors(context, items):
             try:
                 label_domain = context._extents
@@ -87,18 +300,59 @@ class TopRSimilarity:
             context, list(TopRSimilarity._r_values_or_until_differs(metric_2_order, r))
         )
 
+        if max_memory is not None and is_vectorized(similarity):
+            vectors_1 = to_bools(vectors_1)
+            vectors_2 = to_bools(vectors_2)
+
+            i1 = blocked_row_max(vectors_2, vectors_1, similarity, max_memory).mean()
+            i2 = blocked_row_max(vectors_1, vectors_2, similarity, max_memory).mean()
+
+            return min(i1, i2)
+
         i1 = mean((max((similarity(b1, b2) for b2 in vectors_1)) for b1 in vectors_2))
 
         i2 = mean((max((similarity(b1, b2) for b2 in vectors_2)) for b1 in vectors_1))
 
         return min(i1, i2)
 
+    @staticmethod
+    def _results_frame(r_range, values, labels, value_label, error=None):
+        """Long results table built from (labels x r) matrix of values.
+
+        Args:
+            r_range (range): r values
+            values (np.ndarray): float32 matrix, one row per label
+            labels (list): labels of rows
+            value_label (str): name of the value column
+            error (np.ndarray, optional): when specified, matrix of errors of values included as "error" column. Defaults to None.
+
+        Returns:
+            pd.DataFrame: table with r (int32), values (float32) and categorical label
+        """
+        n_labels, n_r = values.shape
+        r_values = np.arange(r_range.start, r_range.stop, dtype=np.int32)
+        # labels repeat e.g. when to_columns repeats a column
+        codes, categories = pd.factorize(pd.Index(labels, dtype=object))
+
+        df = pd.DataFrame(
+            {
+                "r": np.tile(r_values, n_labels),
+                value_label: values.ravel(),
+                "label": pd.Categorical.from_codes(
+                    np.repeat(codes.astype(np.int32), n_r), categories=categories
+                ),
+            }
+        )
+
+        if error is not None:
+            df["error"] = np.asarray(error, dtype=np.float32).ravel()
+
+        return df
+
     @staticmethod
     def _init(inst, to_columns):
         r_range = range(1, len(inst._source.index))
 
-        results = []
-
         # filtered_columns = filter(
         #     lambda c: c not in ignore_columns, inst._source.columns
         # )
@@ -108,37 +362,64 @@ class TopRSimilarity:
             [(x, y) for x in inst._source.columns for y in to_columns if x != y],
         )
 
-        for (column1_order, column2_order), label in zip(columns_tuples, labels):
-            for r in r_range:
-                results.append(
-                    [
-                        r,
-                        inst._top_r_similarity(
-                            inst._context,
-                            inst._similarity,
-                            column1_order,
-                            column2_order,
-                            r,
-                        ),
-                        label,
-                    ]
+        values = np.empty((len(labels), len(r_range)), dtype=np.float32)
+
+        if inst._lsh is not None:
+            errors = np.empty_like(values)
+
+            for row, (column1_order, column2_order) in enumerate(columns_tuples):
+                values[row], errors[row] = inst._approximate_top_r_similarity(
+                    inst, column1_order, column2_order, r_range
+                )
+
+            return inst._results_frame(
+                r_range, values, labels, "top_r_similarity", errors
+            )
+
+        for row, (column1_order, column2_order) in enumerate(columns_tuples):
+            for column, r in enumerate(r_range):
+                values[row, column] = inst._top_r_similarity(
+                    inst._context,
+                    inst._similarity,
+                    column1_order,
+                    column2_order,
+                    r,
+                    inst._max_memory,
                 )
 
-        return pd.DataFrame(results, columns=["r", "top_r_similarity", "label"])
+        return inst._results_frame(r_range, values, labels, "top_r_similarity")
 
-    def to_plotly(self) -> "go.Figure":
+    def _export_frame(self):
+        return self.df
+
+    def to_plotly(self, webgl: bool = False, max_points: int = None) -> "go.Figure":
         """Generates plotly figure.
 
+        Args:
+            webgl (bool, optional): if lines are rendered by WebGL. Defaults to False.
+            max_points (int, optional): when specified, every curve is downsampled by LTTB to max_points. Defaults to None.
+
         Returns:
             go.Figure: figure
         """
+        import plotly.express as px
+
+        df = self.df
+
+        if max_points is not None:
+            df = pd.concat(
+                group.iloc[lttb(group["r"], group[df.columns[1]], max_points)]
+                for _, group in df.groupby("label", sort=False)
+            )
+
         fig = px.line(
-            self.df,
+            df,
             x="r",
-            y=self.df.columns[1],
+            y=df.columns[1],
             color="label",
             labels={"label": "Legend"},
             line_dash="label",
+            render_mode="webgl" if webgl else "auto",
         )
 
         # layout needs some cleaning
@@ -177,18 +458,24 @@ class TopRSimilarity:
         return fig
 
     def to_plotly_html(
-        self, default_width: int = 700, default_height: int = 390
+        self,
+        default_width: int = 700,
+        default_height: int = 390,
+        webgl: bool = False,
+        max_points: int = None,
     ) -> str:
         """Generates html version of plotly graph
 
         Args:
             default_width (int, optional): default graph width. Defaults to 700.
             default_height (int, optional): default graph height. Defaults to 390.
+            webgl (bool, optional): if lines are rendered by WebGL, see to_plotly. Defaults to False.
+            max_points (int, optional): downsampling threshold, see to_plotly. Defaults to None.
 
         Returns:
             str: graph html
         """
-        return self.to_plotly().to_html(
+        return self.to_plotly(webgl=webgl, max_points=max_points).to_html(
             full_html=False,
             include_plotlyjs="cdn",
             include_mathjax="cdn",
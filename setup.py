@@ -14,14 +14,20 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "fcapsy",
-        "plotly",
-        "pandas",
+        "plotly>=5.19",
+        "pandas>=1.4",
         "binsdpy",
         "sklearn",
         "fuzzycorr",
         "scipy",
         "numpy",
     ],
+    extras_require={
+        "arrow": ["pyarrow"],
+    },
+    entry_points={
+        "console_scripts": ["fcapsy-experiments=fcapsy_experiments.cli:main"],
+    },
     long_description=pathlib.Path("README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     classifiers=[
@@ -0,0 +1,81 @@
+import concepts
+import numpy as np
+import pytest
+
+from fcapsy_experiments._concept_view import concept_view
+from fcapsy_experiments.mca import MCAConcept, MCAModel
+
+
+@pytest.fixture(scope="module")
+def lattice():
+    rng = np.random.default_rng(0)
+    bools = rng.random((30, 8)) < 0.5
+
+    context = concepts.Context(
+        [f"o{idx}" for idx in range(30)],
+        [f"a{idx}" for idx in range(8)],
+        bools.tolist(),
+    )
+
+    return context.lattice
+
+
+@pytest.fixture(scope="module")
+def parent(lattice):
+    return MCAConcept(lattice.supremum)
+
+
+@pytest.fixture(scope="module")
+def child(lattice):
+    # child which misses some attributes of the parent
+    for concept in lattice:
+        if (
+            len(concept.extent) >= 5
+            and not concept_view(concept).rows.any(axis=0).all()
+        ):
+            return concept
+
+    raise AssertionError("no suitable concept")
+
+
+def test_child_is_projected_by_parent_model(parent, child):
+    projected = MCAConcept(child, model=parent.model)
+
+    assert set(projected.concept_df.columns) < set(parent.concept_df.columns)
+    np.testing.assert_allclose(
+        projected.concept_df_transformed.to_numpy(),
+        parent.concept_df_transformed.loc[list(child.extent)].to_numpy(),
+    )
+
+
+def test_save_load_round_trip(tmp_path, parent, child):
+    path = tmp_path / "model.pickle"
+    parent.save_model(path)
+
+    loaded = MCAModel.load(path)
+
+    assert loaded.columns == parent.model.columns
+    np.testing.assert_allclose(
+        MCAConcept(child, model=path).concept_df_transformed.to_numpy(),
+        MCAConcept(child, model=parent.model).concept_df_transformed.to_numpy(),
+    )
+
+
+def test_refit_keeps_orientation_of_previous_model(parent, child):
+    previous = parent.model
+    df = MCAConcept(child, model=previous).concept_df
+
+    refitted = MCAModel.fit(df, previous=previous)
+
+    before = previous.transform(df).to_numpy()
+    after = refitted.transform(df).to_numpy()
+
+    assert refitted.columns[: len(previous.columns)] == previous.columns
+    assert ((before * after).sum(axis=0) >= 0).all()
+
+    # components of the same fit follow flipped previous model
+    flipped = MCAModel(previous.mca, previous.columns, -previous.signs)
+
+    np.testing.assert_allclose(
+        MCAModel.fit(df, previous=flipped).transform(df).to_numpy(), -after
+    )
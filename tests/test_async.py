@@ -0,0 +1,105 @@
+import asyncio
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+
+import concepts
+import pandas as pd
+import pytest
+
+from fcapsy_experiments._async import AsyncMixin, make_key, run_shared
+from fcapsy_experiments.centrality import Centrality
+
+
+def test_run_shared_deduplicates_concurrent_calls():
+    calls = []
+    release = threading.Event()
+
+    def compute(value):
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+
+    async def main():
+        tasks = [asyncio.create_task(run_shared("key", compute, 21)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(main()) == [42] * 5
+    assert calls == [21]
+
+
+def test_run_shared_cancelled_awaiter_does_not_cancel_others():
+    release = threading.Event()
+
+    def compute():
+        release.wait(5)
+        return "done"
+
+    async def main():
+        first = asyncio.create_task(run_shared("key", compute))
+        second = asyncio.create_task(run_shared("key", compute))
+        await asyncio.sleep(0.05)
+
+        first.cancel()
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        return await second
+
+    assert asyncio.run(main()) == "done"
+
+
+def test_make_key_of_unhashable_values():
+    config = {"args": {"J": [1, 2]}}
+
+    assert make_key(config) == make_key({"args": {"J": [1, 2]}})
+    assert hash(make_key(config, {1: object()}))
+
+
+def test_make_key_ignores_keyword_order():
+    assert make_key({"a": 1, "b": [2]}) == make_key({"b": [2], "a": 1})
+
+
+def test_acompute_shares_computation_of_same_arguments():
+    calls = []
+
+    class Experiment(AsyncMixin):
+        def __init__(self, concept, axis=0, count=False):
+            calls.append((concept, axis, count))
+
+    async def main():
+        return await asyncio.gather(
+            Experiment.acompute("concept", axis=1, count=True),
+            Experiment.acompute("concept", count=True, axis=1),
+        )
+
+    first, second = asyncio.run(main())
+
+    assert first is second
+    assert calls == [("concept", 1, True)]
+
+
+def test_acompute_in_process_pool():
+    lattice = concepts.Context.fromstring(concepts.EXAMPLE).lattice
+    concept = lattice[18]
+
+    async def main(executor):
+        return await asyncio.gather(
+            Centrality.acompute(concept, axis=0, executor=executor),
+            Centrality.acompute(concept, axis=0, executor=executor),
+        )
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        first, second = asyncio.run(main(executor))
+
+        # pool stays usable
+        assert executor.submit(abs, -1).result() == 1
+
+    assert first is second
+    assert first._concept is concept
+    pd.testing.assert_frame_equal(first.df, Centrality(concept, axis=0).df)
+    assert "<table" in first.to_html()
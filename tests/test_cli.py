@@ -0,0 +1,91 @@
+import json
+
+import concepts
+import pytest
+
+from fcapsy_experiments import cli
+
+
+@pytest.fixture
+def contexts_dir(tmp_path):
+    directory = tmp_path / "contexts"
+    directory.mkdir()
+
+    # last object has every attribute, so no concept has empty extent
+    context = concepts.Context(
+        ["o1", "o2", "o3"],
+        ["a", "b", "c"],
+        [(True, False, True), (False, True, True), (True, True, True)],
+    )
+    context.tofile(str(directory / "example.cxt"), frmat="cxt")
+    context.tofile(str(directory / "example.csv"), frmat="csv")
+
+    return directory
+
+
+def _write_spec(tmp_path, **spec):
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps({"experiments": ["centrality"], **spec}))
+
+    return str(path)
+
+
+def _records(output_dir):
+    with open(output_dir / cli.CHECKPOINT, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_read_checkpoint_skips_errors_and_interrupted_line(tmp_path):
+    (tmp_path / cli.CHECKPOINT).write_text(
+        '{"job": "a", "status": "done", "seconds": 1}\n'
+        '{"job": "b", "status": "error", "error": "boom"}\n'
+        '{"job": "c", "sta'
+    )
+
+    assert cli._read_checkpoint(tmp_path) == {"a"}
+    assert cli._read_checkpoint(tmp_path / "missing") == set()
+
+
+def test_main_writes_outputs_of_every_context_and_resumes(tmp_path, contexts_dir):
+    output_dir = tmp_path / "output"
+    argv = [str(contexts_dir), _write_spec(tmp_path), str(output_dir), "-j", "2"]
+
+    assert cli.main(argv) == 0
+
+    records = _records(output_dir)
+    n_concepts = len(concepts.load(str(contexts_dir / "example.cxt")).lattice)
+
+    assert len(records) == 2 * n_concepts
+    assert all(record["status"] == "done" for record in records)
+    assert len(list((output_dir / "example.cxt").iterdir())) == n_concepts
+    assert len(list((output_dir / "example.csv").iterdir())) == n_concepts
+
+    # finished jobs are not run again
+    assert cli.main(argv) == 0
+    assert len(_records(output_dir)) == 2 * n_concepts
+
+
+def test_main_runs_default_experiments(tmp_path, contexts_dir):
+    (contexts_dir / "example.csv").unlink()
+    output_dir = tmp_path / "output"
+    spec = tmp_path / "spec.json"
+    spec.write_text(json.dumps({"axes": [0, 1]}))
+
+    assert cli.main([str(contexts_dir), str(spec), str(output_dir)]) == 0
+
+    records = _records(output_dir)
+    lattice = concepts.load(str(contexts_dir / "example.cxt")).lattice
+    n_mca = sum(len(concept.extent) > 1 for concept in lattice)
+
+    assert len(records) == 2 * 2 * len(lattice) + n_mca
+    assert all(record["status"] == "done" for record in records)
+
+    for experiment in cli.EXPERIMENTS:
+        assert any(f":{experiment}:" in record["job"] for record in records)
+
+
+def test_main_rejects_unknown_similarity(tmp_path, contexts_dir):
+    spec = _write_spec(tmp_path, similarities=["jacard"])
+
+    with pytest.raises(SystemExit):
+        cli.main([str(contexts_dir), spec, str(tmp_path / "output")])
@@ -0,0 +1,32 @@
+import gc
+import weakref
+
+import concepts
+
+from fcapsy_experiments import _concept_view
+from fcapsy_experiments._concept_view import concept_view
+
+
+def test_view_is_cached_per_concept_and_axis():
+    lattice = concepts.Context.fromstring(concepts.EXAMPLE).lattice
+
+    assert concept_view(lattice[3], 0) is concept_view(lattice[3], 0)
+    assert concept_view(lattice[3], 1) is not concept_view(lattice[3], 0)
+    assert concept_view(lattice[4], 0) is not concept_view(lattice[3], 0)
+
+
+def test_cache_does_not_keep_concepts_alive():
+    context = concepts.Context.fromstring(concepts.EXAMPLE)
+    concept_view(context.lattice[3])
+
+    context_ref = weakref.ref(context)
+    del context
+    gc.collect()
+
+    assert context_ref() is None
+
+    # next lookup drops views of collected concepts
+    lattice = concepts.Context.fromstring(concepts.EXAMPLE).lattice
+    concept_view(lattice[3])
+
+    assert all(ref() is not None for ref, _ in _concept_view._cache.values())
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from fcapsy_experiments._export import to_parquet
+from fcapsy_experiments.correlation_table import CorrelationTable
+
+
+@pytest.fixture
+def results():
+    return pd.DataFrame({"item": ["a", "b"], "value": [0.5, 0.25]})
+
+
+def test_appends_into_partitioned_dataset(tmp_path, results):
+    to_parquet(results, tmp_path, dataset="d1", concept="c1")
+    to_parquet(results, tmp_path, dataset="d1", concept="c2")
+
+    table = pq.read_table(tmp_path).to_pandas()
+
+    assert len(table) == 4
+    assert sorted(table["concept"].astype(str).unique()) == ["c1", "c2"]
+
+
+def test_rejects_mixed_partition_layouts(tmp_path, results):
+    to_parquet(results, tmp_path, dataset="d1")
+
+    with pytest.raises(ValueError):
+        to_parquet(results, tmp_path, dataset="d1", concept="c1")
+
+
+def test_correlation_export_of_selected_types():
+    rng = np.random.default_rng(0)
+    correlations = CorrelationTable(
+        pd.DataFrame(rng.random((10, 3)), columns=["x", "y", "z"]), dataset="d"
+    )
+
+    table = correlations.to_arrow(types=["kendall", "pearson"]).to_pandas()
+
+    assert sorted(table["correlation"].astype(str).unique()) == ["kendall", "pearson"]
+    assert len(table) == 2 * 9
+    assert correlations._fuzzy is None
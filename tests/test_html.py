@@ -0,0 +1,40 @@
+import re
+
+import numpy as np
+
+from fcapsy_experiments import _html
+from fcapsy_experiments._html import iter_table, rows_slice
+
+
+def _rows(html):
+    return re.findall(r"<tr>(.*?)</tr>", html)
+
+
+def test_page_is_colored_as_in_whole_table():
+    columns = [("name", [f"o{idx}" for idx in range(10)]), ("value", np.arange(10.0))]
+
+    whole = _rows("".join(iter_table(columns)))
+    page = _rows("".join(iter_table(columns, rows=rows_slice(page=1, page_size=4))))
+
+    assert page == whole[4:8]
+
+
+def test_rows_are_rendered_in_chunks(monkeypatch):
+    monkeypatch.setattr(_html, "_CHUNK_ROWS", 3)
+    formatted = []
+    _format = _html._format
+
+    def counting_format(values, precision):
+        formatted.append(len(values))
+        return _format(values, precision)
+
+    monkeypatch.setattr(_html, "_format", counting_format)
+
+    chunks = iter_table([("value", np.arange(10.0))])
+
+    for chunk in chunks:
+        if "<tr><td" in chunk:
+            break
+
+    assert formatted == [3]
+    assert sum(len(_rows(chunk)) for chunk in chunks) == 7
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "plotly", "scipy", "sklearn", "prince", "fuzzycorr"]
+
+
+def _import_in_subprocess(statement):
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, *[m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    return float(output[0]), output[1:]
+
+
+def test_import_does_not_load_heavy_modules():
+    for statement in [
+        "import fcapsy_experiments",
+        "import fcapsy_experiments.typicality",
+        "import fcapsy_experiments.centrality",
+        "import fcapsy_experiments.mca",
+    ]:
+        _, loaded = _import_in_subprocess(statement)
+
+        assert loaded == [], statement
+
+
+def test_import_time():
+    elapsed, _ = _import_in_subprocess("import fcapsy_experiments")
+
+    assert elapsed < 0.1
+
+
+def test_dir_lists_lazy_names_and_module_globals():
+    import fcapsy_experiments
+    import fcapsy_experiments.typicality
+
+    names = dir(fcapsy_experiments)
+
+    assert {"CorrelationTable", "Report", "__version__", "__author__"} <= set(names)
+    assert names == sorted(names)
+    assert "TopRSimilarity" in dir(fcapsy_experiments.typicality)
@@ -0,0 +1,62 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scipy.stats import kendalltau
+
+from fcapsy_experiments._permutation import (
+    kendall_statistic,
+    permutation_p_value,
+    permutation_p_values,
+)
+
+
+@pytest.mark.parametrize("n", [6, 8, 10])
+def test_p_value_matches_exact_kendall_test(n):
+    rng = np.random.default_rng(n)
+    x = rng.permutation(n).astype(float)
+    y = x + rng.normal(0, n / 3, n)
+
+    # without early stopping
+    p_value = permutation_p_value(
+        x, y, permutations=20000, seed=0, min_permutations=20000
+    )
+
+    assert p_value == pytest.approx(kendalltau(x, y, method="exact").pvalue, abs=0.01)
+
+
+def test_kendall_statistic_with_ties():
+    x = np.array([1, 1, 2, 3, 3, 4, 1])
+    y = np.array([2, 1, 1, 5, 3, 3, 2])
+
+    expected = sum(
+        np.sign(x[j] - x[i]) * np.sign(y[j] - y[i])
+        for i, j in itertools.combinations(range(len(x)), 2)
+    )
+
+    assert kendall_statistic(x, y) == expected
+
+
+def test_missing_values_are_dropped_as_in_corr():
+    rng = np.random.default_rng(0)
+    source = pd.DataFrame(rng.random((30, 2)), columns=["a", "b"])
+    source.loc[[3, 7, 11], "b"] = np.nan
+
+    p_values = permutation_p_values(source, permutations=500, random_state=0)
+    expected = permutation_p_values(source.dropna(), permutations=500, random_state=0)
+
+    pd.testing.assert_frame_equal(p_values, expected)
+    assert p_values.loc["a", "b"] > 0.04
+
+
+def test_clear_correlation_stops_after_min_permutations():
+    rng = np.random.default_rng(0)
+    x = rng.random(2000)
+    y = x + rng.normal(0, 0.01, len(x))
+
+    p_value = permutation_p_value(x, y, seed=0, min_permutations=100)
+
+    # no permutation reaches observed statistic, p-value is 1 / (done + 1)
+    assert p_value == pytest.approx(1 / 101)
@@ -0,0 +1,68 @@
+import concepts
+import numpy as np
+import pandas as pd
+import pytest
+
+from fcapsy_experiments._plotting import density_bins, lttb
+from fcapsy_experiments.mca import MCAConcept
+from fcapsy_experiments.typicality import ConceptTypicality, TopRSimilarity
+
+
+@pytest.fixture(scope="module")
+def lattice():
+    return concepts.Context.fromstring(concepts.EXAMPLE).lattice
+
+
+@pytest.mark.parametrize("threshold", [3, 10, 57])
+def test_lttb_keeps_endpoints_and_threshold_increasing_indices(threshold):
+    rng = np.random.default_rng(0)
+    x = np.arange(200)
+    y = rng.random(200)
+
+    selected = lttb(x, y, threshold)
+
+    assert len(selected) == threshold
+    assert selected[0] == 0 and selected[-1] == len(x) - 1
+    assert (np.diff(selected) > 0).all()
+
+
+def test_lttb_keeps_all_points_under_threshold():
+    np.testing.assert_array_equal(lttb(range(5), range(5), 10), np.arange(5))
+
+
+def test_density_bins_count_every_row():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.random((500, 3)), columns=["x", "y", "value"])
+
+    binned = density_bins(data, ["x", "y"], 7)
+
+    assert binned["count"].sum() == len(data)
+    assert len(binned) <= 7 * 7
+
+
+def test_webgl_figures_use_scattergl(lattice):
+    concept = lattice.supremum
+    typicality = ConceptTypicality(concept)
+
+    figures = [
+        typicality.to_plotly(webgl=True),
+        TopRSimilarity(typicality.df, lattice._context).to_plotly(webgl=True),
+        MCAConcept(concept).to_plotly(webgl=True),
+    ]
+
+    for figure in figures:
+        assert {trace.type for trace in figure.data} == {"scattergl"}
+
+
+def test_max_points_downsamples_curves(lattice):
+    typicality = ConceptTypicality(lattice.supremum)
+    figure = TopRSimilarity(typicality.df, lattice._context).to_plotly(max_points=5)
+
+    assert all(len(trace.x) == 5 for trace in figure.data)
+
+
+def test_bins_aggregate_mca_points(lattice):
+    concept = lattice.supremum
+    figure = MCAConcept(concept).to_plotly(bins=3)
+
+    assert sum(sum(trace.marker.size) for trace in figure.data) == len(concept.extent)
@@ -0,0 +1,67 @@
+import base64
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from plotly.offline import get_plotlyjs
+
+from fcapsy_experiments.report import Report, _TYPED_ARRAYS, _pack_array
+
+
+def _unpack(packed):
+    array = np.frombuffer(base64.b64decode(packed["bdata"]), dtype=packed["dtype"])
+
+    if "shape" in packed:
+        array = array.reshape([int(size) for size in packed["shape"].split(", ")])
+
+    return array
+
+
+@pytest.mark.parametrize("dtype", list(_TYPED_ARRAYS))
+def test_pack_array_round_trips(dtype):
+    array = np.arange(12).reshape(3, 4).astype(dtype)
+
+    packed = _pack_array(array)
+
+    assert packed["dtype"] == _TYPED_ARRAYS[dtype]
+    np.testing.assert_array_equal(_unpack(packed), array)
+    np.testing.assert_array_equal(_unpack(_pack_array(array[0])), array[0])
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint64"])
+def test_pack_array_narrows_64_bit_integers(dtype):
+    array = np.array([0, 7, 2**31 - 1], dtype=dtype)
+
+    packed = _pack_array(array)
+
+    assert packed["dtype"] in ("i4", "u4")
+    np.testing.assert_array_equal(_unpack(packed), array)
+
+
+def test_pack_array_keeps_large_integers_exact():
+    values = [-(2**40), 2**53 + 1]
+
+    assert _pack_array(np.array(values, dtype=np.int64)) == values
+    assert _pack_array(np.array([2**63], dtype=np.uint64)) == [2**63]
+
+
+def test_pack_array_lists_other_dtypes():
+    assert _pack_array(np.array(["a", "b"])) == ["a", "b"]
+    assert _pack_array(np.array([True, False])) == [True, False]
+
+
+def test_report_html_is_self_contained():
+    figure = go.Figure(go.Scatter(x=np.arange(3), y=[1, 2, 3], name="</script>"))
+
+    report = Report(title="<Report>").add(figure, title="first").add(figure)
+    output = report.to_html()
+
+    assert output.count("Plotly.newPlot(") == 2
+    # plotly.js is inlined once
+    assert output.count(get_plotlyjs()) == 1
+    assert output.count('<script type="text/javascript">') == 3
+    assert "<script src=" not in output
+    assert "<\\/script>" in output
+    assert output.count("</script>") == 3
+    assert "<title>&lt;Report&gt;</title>" in output
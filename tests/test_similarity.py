@@ -0,0 +1,86 @@
+import concepts
+import numpy as np
+import pytest
+
+from binsdpy.similarity import jaccard, smc, russell_rao
+from fcapsy.typicality import typicality_avg
+
+from fcapsy_experiments._concept_view import concept_view
+from fcapsy_experiments._similarity import (
+    blocked_row_max,
+    blocked_row_means,
+    tile_shape,
+)
+from fcapsy_experiments.typicality.top_r_similarity import TopRSimilarity
+
+SIMILARITIES = [jaccard, smc, russell_rao]
+
+# None is single tile, 1 byte forces tiles of single row
+MAX_MEMORIES = [None, 1, 1000, 10**6]
+
+
+@pytest.fixture(scope="module")
+def context():
+    rng = np.random.default_rng(0)
+    bools = rng.random((15, 9)) < 0.4
+    # scalar jaccard is undefined for pairs of empty rows
+    bools[np.arange(15), np.arange(15) % 9] = True
+
+    return concepts.Context(
+        [f"o{idx}" for idx in range(15)],
+        [f"a{idx}" for idx in range(9)],
+        bools.tolist(),
+    )
+
+
+@pytest.mark.parametrize("similarity", SIMILARITIES)
+@pytest.mark.parametrize("max_memory", MAX_MEMORIES)
+@pytest.mark.parametrize("axis", [0, 1])
+def test_blocked_row_means_match_typicality_avg(context, similarity, max_memory, axis):
+    concept = context.lattice.supremum if axis == 0 else context.lattice.infimum
+    view = concept_view(concept, axis)
+
+    expected = [
+        typicality_avg(item, concept, similarity=similarity) for item in view.core
+    ]
+    means = blocked_row_means(view.rows, view.rows, similarity, max_memory)
+
+    np.testing.assert_allclose(means, expected)
+
+
+@pytest.mark.parametrize("similarity", SIMILARITIES)
+@pytest.mark.parametrize("max_memory", MAX_MEMORIES[1:])
+def test_blocked_row_max_matches_scalar_top_r(context, similarity, max_memory):
+    order_1 = list(context.objects)
+    order_2 = list(reversed(context.objects))
+
+    for r in range(1, len(order_1)):
+        expected = TopRSimilarity._top_r_similarity(
+            context, similarity, order_1, order_2, r
+        )
+        blocked = TopRSimilarity._top_r_similarity(
+            context, similarity, order_1, order_2, r, max_memory
+        )
+
+        assert blocked == pytest.approx(expected)
+
+
+def test_blocked_row_max_of_single_row_tiles():
+    X = np.array([[1, 0, 1], [0, 1, 1], [0, 0, 0]], dtype=bool)
+    Y = np.array([[1, 0, 1], [1, 1, 1]], dtype=bool)
+
+    np.testing.assert_allclose(
+        blocked_row_max(X, Y, jaccard, max_memory=1),
+        blocked_row_max(X, Y, jaccard),
+    )
+
+
+@pytest.mark.parametrize("max_memory", [1000, 10**5, 10**7])
+def test_tile_shape_fits_budget_with_float_rows(max_memory):
+    n_rows, n_columns, n_features = 5000, 4000, 50
+
+    rows, columns = tile_shape(n_rows, n_columns, n_features, max_memory)
+    used = rows * columns * 64 + (rows + columns) * n_features * 8
+
+    assert used <= max_memory
+    assert columns <= n_columns
@@ -0,0 +1,80 @@
+import concepts
+import numpy as np
+import pandas as pd
+import pytest
+
+from fcapsy_experiments.typicality import ConceptTypicality, TypicalityBootstrap
+
+
+@pytest.fixture(scope="module")
+def lattice():
+    rng = np.random.default_rng(0)
+    bools = rng.random((15, 8)) < 0.4
+    bools[np.arange(15), np.arange(15) % 8] = True
+
+    context = concepts.Context(
+        [f"o{idx}" for idx in range(15)],
+        [f"a{idx}" for idx in range(8)],
+        bools.tolist(),
+    )
+
+    return context.lattice
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_unit_weights_reproduce_typicality_ranks(lattice, axis):
+    concept = lattice.supremum if axis == 0 else lattice.infimum
+
+    bootstrap = TypicalityBootstrap(concept, axis=axis, n_replicates=5, random_state=0)
+    typicality = ConceptTypicality(concept, axis=axis)
+
+    for column in typicality.df.columns:
+        expected = typicality.df[column].rank(ascending=False, method="average")
+
+        np.testing.assert_allclose(bootstrap.df[f"{column} rank"], expected)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_random_state_is_reproducible_across_n_jobs(lattice, axis):
+    concept = lattice.supremum if axis == 0 else lattice.infimum
+
+    serial = TypicalityBootstrap(
+        concept, axis=axis, n_replicates=20, random_state=0, n_jobs=1
+    )
+    parallel = TypicalityBootstrap(
+        concept, axis=axis, n_replicates=20, random_state=0, n_jobs=4
+    )
+
+    pd.testing.assert_frame_equal(serial.df, parallel.df)
+
+    for column, replicates in serial.replicates.items():
+        pd.testing.assert_frame_equal(replicates, parallel.replicates[column])
+
+
+def test_interval_contains_full_rank_of_separated_item():
+    rng = np.random.default_rng(0)
+    bools = np.zeros((60, 12), dtype=bool)
+    bools[:, :6] = rng.random((60, 6)) < 0.9
+    # last object shares nothing with the others
+    bools[-1] = False
+    bools[-1, 6:] = True
+
+    context = concepts.Context(
+        [f"o{idx}" for idx in range(60)],
+        [f"a{idx}" for idx in range(12)],
+        bools.tolist(),
+    )
+
+    bootstrap = TypicalityBootstrap(
+        context.lattice.supremum, n_replicates=200, random_state=0
+    )
+
+    for column in bootstrap._similarities:
+        rank = bootstrap.df.loc["o59", f"{column} rank"]
+
+        assert rank == 60
+        assert (
+            bootstrap.df.loc["o59", f"{column} lower"]
+            <= rank
+            <= bootstrap.df.loc["o59", f"{column} upper"]
+        )
@@ -0,0 +1,112 @@
+import concepts
+import numpy as np
+import pytest
+
+from fcapsy_experiments.typicality import ConceptTypicality
+
+
+@pytest.fixture(scope="module")
+def concept():
+    rng = np.random.default_rng(0)
+    bools = rng.random((20, 8)) < 0.4
+    bools[np.arange(20), np.arange(20) % 8] = True
+
+    context = concepts.Context(
+        [f"o{idx}" for idx in range(20)],
+        [f"a{idx}" for idx in range(8)],
+        bools.tolist(),
+    )
+
+    return context.lattice.supremum
+
+
+def test_sample_of_whole_core_is_exact(concept):
+    exact = ConceptTypicality(concept)
+    sampled = ConceptTypicality(
+        concept, sample_size=len(concept.extent), random_state=0
+    )
+
+    intervals = sampled.confidence_intervals
+
+    for column in exact.df.columns:
+        np.testing.assert_allclose(sampled.df[column], exact.df[column])
+        np.testing.assert_allclose(intervals[f"{column} lower"], exact.df[column])
+        np.testing.assert_allclose(intervals[f"{column} upper"], exact.df[column])
+
+
+def test_blocked_sample_matches_single_tile(concept):
+    single = ConceptTypicality(concept, sample_size=10, random_state=0)
+    # tiles of single row and single sampled item
+    blocked = ConceptTypicality(concept, sample_size=10, random_state=0, max_memory=1)
+
+    np.testing.assert_allclose(blocked.df, single.df)
+    np.testing.assert_allclose(
+        blocked.confidence_intervals, single.confidence_intervals
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"sample_size": 0},
+        {"target_error": 0},
+        {"target_error": -0.1},
+        {"target_error": 0.1, "confidence": 0},
+        {"target_error": 0.1, "confidence": 1},
+    ],
+)
+def test_invalid_sampling_arguments(concept, kwargs):
+    with pytest.raises(ValueError):
+        ConceptTypicality(concept, **kwargs)
+
+
+def _context(intents):
+    properties = [f"a{idx}" for idx in range(8)]
+
+    return concepts.Context(
+        list(intents),
+        properties,
+        [[prop in intent for prop in properties] for intent in intents.values()],
+    )
+
+
+def test_update_equals_full_recompute(concept):
+    context = concept.lattice._context
+    intents = {obj: context.intension([obj]) for obj in context.objects}
+
+    typicality = ConceptTypicality(concept, count=True)
+
+    deltas = [
+        ({}, ["o0", "o5"]),
+        ({"n0": ["a0", "a3"], "n1": ["a1"], "n2": ["a0", "a1", "a7"]}, []),
+        ({"n3": ["a2", "a4"], "o0": ["a5"]}, ["n1", "o7", "o8"]),
+    ]
+
+    for added, removed in deltas:
+        typicality.update(added, removed)
+
+        for obj in removed:
+            del intents[obj]
+
+        intents.update(added)
+
+        expected = ConceptTypicality(_context(intents).lattice.supremum, count=True)
+
+        assert sorted(typicality.df.index) == sorted(expected.df.index)
+        np.testing.assert_allclose(
+            typicality.df.loc[expected.df.index].to_numpy(),
+            expected.df.to_numpy(),
+        )
+
+
+def test_update_rejects_invalid_changes(concept):
+    typicality = ConceptTypicality(concept)
+
+    with pytest.raises(ValueError):
+        typicality.update(removed_objects=["unknown"])
+
+    with pytest.raises(ValueError):
+        typicality.update({"o1": ["a0"]})
+
+    with pytest.raises(ValueError):
+        typicality.update({"n0": ["unknown"]})
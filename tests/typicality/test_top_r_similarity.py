@@ -0,0 +1,97 @@
+import concepts
+import numpy as np
+import pandas as pd
+import pytest
+
+from fcapsy_experiments._similarity import pairwise_similarity
+from fcapsy_experiments.typicality import top_r_similarity
+from fcapsy_experiments.typicality.top_bottom_r_similarity import TopBottomRSimilarity
+from fcapsy_experiments.typicality.top_r_similarity import TopRSimilarity
+
+
+def test_prefix_length_matches_r_values_or_until_differs():
+    l1 = [1, 2, 3, 4, 4, 4, 4, 5, 6, 7]
+
+    for r in range(1, 15):
+        assert TopRSimilarity._prefix_length(l1, r) == len(
+            list(TopRSimilarity._r_values_or_until_differs(l1, r))
+        )
+
+
+def _random_context(n_objects, n_attributes, density, seed):
+    rng = np.random.default_rng(seed)
+    bools = rng.random((n_objects, n_attributes)) < density
+    bools[np.arange(n_objects), np.arange(n_objects) % n_attributes] = True
+
+    context = concepts.Context(
+        [f"o{idx}" for idx in range(n_objects)],
+        [f"a{idx}" for idx in range(n_attributes)],
+        bools.tolist(),
+    )
+    source = pd.DataFrame(
+        rng.random((n_objects, 2)), index=context.objects, columns=["x", "y"]
+    )
+
+    return context, source
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("cls", [TopRSimilarity, TopBottomRSimilarity])
+def test_approximate_values_are_within_error(cls, seed):
+    context, source = _random_context(120, 15, 0.3, seed)
+
+    exact = cls(source, context, to_columns=["y"], max_memory=10**6).df
+    # large error, so the sample is smaller than long prefixes
+    approximate = cls(
+        source, context, to_columns=["y"], approximate=True, error=0.2, seed=seed
+    ).df
+
+    value = exact.columns[1]
+    difference = (exact[value] - approximate[value]).abs()
+
+    assert (approximate["r"] == exact["r"]).all()
+    assert (difference <= approximate["error"] + 1e-6).all()
+    # short prefixes are sampled whole
+    assert approximate["error"].iloc[0] == 0
+    assert 0 < approximate["error"].max() < 0.2 * cls._curves
+
+
+def test_approximate_pass_is_subquadratic(monkeypatch):
+    counted = []
+
+    def counting(X, Y, *args, **kwargs):
+        counted.append(len(X) * len(Y))
+        return pairwise_similarity(X, Y, *args, **kwargs)
+
+    monkeypatch.setattr(top_r_similarity, "pairwise_similarity", counting)
+
+    n_objects = 1500
+    context, source = _random_context(n_objects, 20, 0.3, 0)
+
+    TopRSimilarity(
+        source, context, to_columns=["y"], approximate=True, error=0.2, seed=0
+    )
+
+    assert sum(counted) < 0.2 * n_objects**2
+
+
+def test_approximate_mode_validates_arguments():
+    context, source = _random_context(10, 5, 0.3, 0)
+
+    with pytest.raises(ValueError):
+        TopRSimilarity(source, context, approximate=True, error=0)
+
+    with pytest.raises(ValueError):
+        TopRSimilarity(source, context, approximate=True, confidence=1)
+
+
+def test_results_frame_with_duplicate_labels():
+    values = np.arange(6, dtype=np.float32).reshape(3, 2)
+
+    df = TopRSimilarity._results_frame(
+        range(1, 3), values, ["x-y", "x-y", "y-x"], "top_r_similarity"
+    )
+
+    assert list(df["label"]) == ["x-y"] * 4 + ["y-x"] * 2
+    assert list(df["label"].cat.categories) == ["x-y", "y-x"]
+    assert list(df["top_r_similarity"]) == list(range(6))